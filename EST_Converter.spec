@@ -0,0 +1,146 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+EST Converter - PyInstaller spec file
+Built by build_exe.py (or directly: pyinstaller EST_Converter.spec)
+
+onedir + noarchive: .pyc files are kept as plain files under _internal/
+instead of a zlib-compressed PYZ archive, so imports at startup skip
+decompression.
+"""
+
+import os
+import shutil
+import sys
+
+APP_NAME = 'EST_Converter'
+ICON_FILE = os.path.join(SPECPATH, 'est_icon.ico')
+VERSION_FILE = os.path.join(SPECPATH, 'version_info.txt')
+
+# Optional data files bundled into _internal/
+datas = [(os.path.join(SPECPATH, name), '.')
+         for name in ('hnz_logo.png', 'est_icon.ico')
+         if os.path.exists(os.path.join(SPECPATH, name))]
+
+hiddenimports = [
+    'openpyxl',
+    'openpyxl.cell',
+    'openpyxl.styles',
+    'dateutil',
+    'serial',
+]
+
+excludes = [
+    # Unneeded scientific stack
+    'matplotlib',
+    'numpy',
+    'pandas',
+    'scipy',
+
+    # Qt modules this app never imports (only QtCore/QtGui/QtWidgets are used)
+    'PySide6.QtQml',
+    'PySide6.QtQuick',
+    'PySide6.QtQuickWidgets',
+    'PySide6.QtDesigner',
+    'PySide6.QtHelp',
+    'PySide6.QtNetwork',
+    'PySide6.QtDBus',
+    'PySide6.QtTest',
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtMultimedia',
+    'PySide6.QtPdf',
+    'PySide6.QtCharts',
+    'PySide6.Qt3DCore',
+    'PySide6.scripts',
+    'shiboken6.files',
+]
+
+# Qt files the PySide6 hooks still collect even with the excludes above
+QT_DROP_PREFIXES = (
+    'PySide6/translations/',
+    'PySide6/Qt/translations/',
+    'PySide6/qml/',
+    'PySide6/Qt/qml/',
+)
+QT_DROP_DLLS = (
+    'opengl32sw.dll',       # Software OpenGL fallback (~20 MB), unused by widgets
+    'd3dcompiler_47.dll',
+    'qt6qml',
+    'qt6quick',
+    'qt6pdf',
+    'qt6network',
+    'qt6opengl',
+    'qt6virtualkeyboard',
+)
+
+# DLLs UPX is known to corrupt
+UPX_EXCLUDE = [
+    'Qt6Core.dll',
+    'Qt6Gui.dll',
+    'Qt6Widgets.dll',
+    'qwindows.dll',
+    'vcruntime140.dll',
+    'python3.dll',
+    f'python3{sys.version_info.minor}.dll',
+]
+
+
+def _keep(entry):
+    """Return False for Qt translation/QML files and unused Qt DLLs"""
+    dest = entry[0].replace('\\', '/')
+    if dest.startswith(QT_DROP_PREFIXES):
+        return False
+    name = os.path.basename(dest).lower()
+    return not name.startswith(QT_DROP_DLLS)
+
+
+a = Analysis(
+    [os.path.join(SPECPATH, 'est_converter.py')],
+    pathex=[SPECPATH],
+    binaries=[],
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=True,         # Loose .pyc files: no PYZ zlib decompress per import
+    optimize=2,             # -OO bytecode (no asserts/docstrings; PyInstaller >= 6.6)
+)
+
+a.binaries = [entry for entry in a.binaries if _keep(entry)]
+a.datas = [entry for entry in a.datas if _keep(entry)]
+
+pyz = PYZ(a.pure)
+
+# Strip debug symbols (needs binutils strip). Never on Windows: PyInstaller
+# advises against it there, and stripping signed python3x/Qt DLLs breaks their
+# Authenticode signatures
+strip = sys.platform != 'win32' and shutil.which('strip') is not None
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,  # onedir: binaries go to COLLECT, not into the EXE
+    name=APP_NAME,
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip,
+    upx=True,               # Only applied when UPX is found (see build_exe.py UPX_DIR)
+    upx_exclude=UPX_EXCLUDE,
+    console=False,          # No console window (GUI only)
+    icon=ICON_FILE if os.path.exists(ICON_FILE) else None,
+    version=VERSION_FILE if os.path.exists(VERSION_FILE) else None,
+    contents_directory='_internal',
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip,
+    upx=True,
+    upx_exclude=UPX_EXCLUDE,
+    name=APP_NAME,
+)
@@ -4,56 +4,47 @@ EST Converter - PyInstaller Build Script
 Creates a standalone Windows executable with all dependencies.
 
 Usage:
-    python build_exe.py
+    python build_exe.py          (incremental build, reuses PyInstaller cache)
+    python build_exe.py --full   (clean rebuild; or set EST_FULL_REBUILD=1)
 
 Output:
-    dist/EST_Converter.exe (standalone executable)
+    dist/EST_Converter/ (application folder containing EST_Converter.exe)
 """
 
 import PyInstaller.__main__
 import os
+import shutil
 import sys
 
 # Configuration
 APP_NAME = "EST_Converter"
 MAIN_SCRIPT = "est_converter.py"
+SPEC_FILE = "EST_Converter.spec"
 ICON_FILE = "est_icon.ico" if os.path.exists("est_icon.ico") else None
 
-# Build arguments
-pyinstaller_args = [
-    MAIN_SCRIPT,
-    f'--name={APP_NAME}',
-    '--onefile',              # Single executable
-    '--windowed',             # No console window (GUI only)
-    '--clean',                # Clean cache before build
-
-    # Icon
-    f'--icon={ICON_FILE}' if ICON_FILE else '',
-
-    # Add data files (templates, logo)
-    '--add-data=example_Good.xlsx;.',
-    '--add-data=EST_Tester.xlsx;.',
-    '--add-data=EST_Limits_Summary.xlsx;.',
-
-    # Optional: Add logo and icon if they exist
-    *(['--add-data=hnz_logo.png;.'] if os.path.exists('hnz_logo.png') else []),
-    *(['--add-data=est_icon.ico;.'] if os.path.exists('est_icon.ico') else []),
+# UPX compression is applied only when UPX is installed (override with UPX_DIR)
+UPX_DIR = os.environ.get('UPX_DIR', 'C:/upx')
+USE_UPX = os.path.isdir(UPX_DIR)
 
-    # Hidden imports (explicit dependencies)
-    '--hidden-import=openpyxl',
-    '--hidden-import=openpyxl.cell',
-    '--hidden-import=openpyxl.styles',
-    '--hidden-import=dateutil',
-    '--hidden-import=serial',
+# Full rebuild wipes PyInstaller's module-analysis cache (slow; use for releases)
+FULL_REBUILD = '--full' in sys.argv or os.environ.get('EST_FULL_REBUILD') == '1'
 
-    # Exclude unnecessary modules (reduce size)
-    '--exclude-module=matplotlib',
-    '--exclude-module=numpy',
-    '--exclude-module=pandas',
-    '--exclude-module=scipy',
+# Template files shipped next to the EXE (not embedded in the bundle)
+TEMPLATE_FILES = [
+    "example_Good.xlsx",
+    "EST Tester.xlsx",
+    "EST_Limits_Summary.xlsx",
+]
 
-    # Version info
-    '--version-file=version_info.txt' if os.path.exists('version_info.txt') else '',
+# Build arguments - all bundle settings (excludes, hidden imports, strip,
+# UPX excludes, noarchive) live in the spec file
+pyinstaller_args = [
+    SPEC_FILE,
+    '--clean' if FULL_REBUILD else '',  # Clean cache only on full rebuild
+    '--workpath=build',       # Fixed cache/output paths so reruns reuse the cache
+    '--distpath=dist',
+    '--noconfirm',            # Replace the previous dist/ folder without prompting
+    f'--upx-dir={UPX_DIR}' if USE_UPX else '',
 ]
 
 # Remove empty strings
@@ -65,8 +56,11 @@ print("=" * 70)
 print(f"\nConfiguration:")
 print(f"  App Name: {APP_NAME}")
 print(f"  Main Script: {MAIN_SCRIPT}")
+print(f"  Spec File: {SPEC_FILE} (onedir, noarchive)")
 print(f"  Icon: {ICON_FILE if ICON_FILE else 'None'}")
-print(f"  Include Templates: Yes")
+print(f"  Build Type: {'Full (clean)' if FULL_REBUILD else 'Incremental'}")
+print(f"  UPX: {UPX_DIR if USE_UPX else 'Not found (no compression)'}")
+print(f"  Templates: Copied next to EXE")
 print(f"  Include Logo: {'Yes' if os.path.exists('hnz_logo.png') else 'No'}")
 print(f"\nBuilding...")
 print("-" * 70)
@@ -74,21 +68,30 @@ print("-" * 70)
 try:
     PyInstaller.__main__.run(pyinstaller_args)
 
+    # Copy templates alongside the EXE (read from there at runtime)
+    dist_dir = os.path.join("dist", APP_NAME)
+    for template in TEMPLATE_FILES:
+        if os.path.exists(template):
+            shutil.copy2(template, dist_dir)
+        else:
+            print(f"⚠ Template not found, copy it manually: {template}")
+
     print("\n" + "=" * 70)
     print("✓ Build Complete!")
     print("=" * 70)
     print(f"\nExecutable location:")
-    print(f"  dist/{APP_NAME}.exe")
+    print(f"  dist/{APP_NAME}/{APP_NAME}.exe")
     print(f"\nDistribution package:")
-    print(f"  1. Copy dist/{APP_NAME}.exe to target system")
-    print(f"  2. Ensure template files are in the same directory:")
+    print(f"  1. Zip the whole dist/{APP_NAME}/ folder (EXE + _internal/)")
+    print(f"     and extract it on the target system")
+    print(f"  2. Template files are copied next to the EXE and must stay there:")
     print(f"     - example_Good.xlsx")
-    print(f"     - EST_Tester.xlsx")
+    print(f"     - EST Tester.xlsx")
     print(f"     - EST_Limits_Summary.xlsx")
     print(f"     - hnz_logo.png (optional)")
     print(f"     - est_icon.ico (optional)")
-    print(f"\nNote: Template files are embedded in the EXE, but can be")
-    print(f"      extracted/modified by placing them alongside the EXE.")
+    print(f"\nNote: The EXE will not start without its _internal/ folder.")
+    print(f"      Always ship the folder, not the EXE on its own.")
     print("=" * 70)
 
 except Exception as e:
@@ -74,14 +74,20 @@ print("=" * 70)
 # Additional check - look for files in nearby directories
 if missing_files:
     print("\nSearching nearby directories...")
-    for root, dirs, files in os.walk('..', topdown=True):
-        # Limit search depth
-        dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', 'venv', 'env']]
-        if root.count(os.sep) - '..'.count(os.sep) > 2:
+    skip_dirs = {'__pycache__', '.git', 'venv', 'env'}
+    missing_set = set(missing_files)
+    # Breadth-first scan with os.scandir (entry types come from the directory
+    # read itself, so no extra stat per file); limit search depth
+    queue = [('..', 0)]
+    while queue:
+        root, depth = queue.pop(0)
+        try:
+            entries = list(os.scandir(root))
+        except OSError:
             continue
-            
-        for missing in missing_files:
-            if missing in files:
-                full_path = os.path.join(root, missing)
-                print(f"   Found: {full_path}")
+        for entry in entries:
+            if entry.name in missing_set and entry.is_file():
+                print(f"   Found: {entry.path}")
                 print(f"   → Copy this file to: {os.getcwd()}")
+            elif depth < 2 and entry.name not in skip_dirs and entry.is_dir(follow_symlinks=False):
+                queue.append((entry.path, depth + 1))
@@ -51,7 +51,7 @@ for f in files_to_check:
 # 4. List all files in current directory
 print(f"\n4. All files in current directory:")
 try:
-    files = [f for f in os.listdir(cwd) if os.path.isfile(os.path.join(cwd, f))]
+    files = [e.name for e in os.scandir(cwd) if e.is_file()]
     xlsx_files = [f for f in files if f.endswith('.xlsx')]
     py_files = [f for f in files if f.endswith('.py')]
     
@@ -15,210 +15,377 @@ Part of EST Converter V3.3 extension (produces equivalent input for core parser)
 """
 
 import csv
+import functools
+import io
+import multiprocessing
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from typing import NamedTuple
+
+
+# <TEST=name> / <TESTAP=name> tag (group 1 set for applied-part tests)
+_TEST_TAG_RE = re.compile(r'<TEST(AP)?=(.+?)>')
+
+# 校准日期格式 MmmDddYyyyy（如 M06D25Y2020）
+_CAL_RE = re.compile(r'^M(\d{2})D(\d{2})Y(\d{4})$')
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_cal_date(cal_date):
+    """校准日期 MmmDddYyyyy → m/d/yyyy（无法解析时原样返回）"""
+    m = _CAL_RE.match(cal_date)
+    if m:
+        return f"{int(m[1])}/{int(m[2])}/{m[3]}"
+    return cal_date
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_datetime(date_str, time_str):
+    """测试日期 yyyy/mm/dd + 时间 → m/d/yyyy time（parser兼容格式）"""
+    date_parts = date_str.split('/')
+    if len(date_parts) == 3:
+        try:
+            return f"{int(date_parts[1])}/{int(date_parts[2])}/{date_parts[0]} {time_str}"
+        except ValueError:
+            pass
+    return f"{date_str} {time_str}"
+
+
+class DTATest(NamedTuple):
+    """单条测试结果（固定字段，比dict更省内存）"""
+    name: str
+    ap_name: str = ''
+    limit: str = ''
+    result: str = ''
+    status: str = ''
+    is_applied_part: bool = False
+
+
+class _DTAHeader:
+    """to_csv使用的header字段（__slots__属性访问；缺省值即CSV中的默认输出）"""
+
+    _DEFAULTS = {
+        'ESA615OPID': '',
+        'DUTEQUIPNUM': '',
+        'ESA615CALTECH': '',
+        'DUTSN': '',
+        'ESA615CALDATE': '',
+        'DUTMANF': '',
+        'ESA615UIFW': '',
+        'DUTMODEL': '',
+        'ESA615SN': '',
+        'DUTLOC': '',
+        'DATEOFTEST': '',
+        'TIMEOFTEST': '',
+        'OTHER': '',
+        'MASTERFILE': '',
+        'STANDARD': '',
+        'PAUSEAFTERON': 'NO',
+        'PAUSEBEFOREOFF': 'NO',
+        'PONDELAY': '1',
+        'POFFDELAY': '0',
+        'TSPEED': 'RAPID',
+        'TMODE': 'AUTO',
+        'HALTONFAIL': 'YES',
+        'MULTIPETEST': 'YES',
+        'INCLUDETIME': 'YES',
+        'MULTIRESSTORE': 'WORST/LAST',
+        'INSVOLTAGE': '500V',
+        'REVERSEPOL': 'YES',
+        'MULTIENCLTEST': 'YES',
+        'CLASSIFICATION': 'I',
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+    def __init__(self, header):
+        for key, default in self._DEFAULTS.items():
+            setattr(self, key, header.get(key, default))
 
 
 class DTAtoCSVConverter:
     """将.dta格式转换为Fluke CSV格式（兼容stable.txt）"""
 
-    def __init__(self, dta_content):
+    # 不写入CSV的测试：消息类（MSGE前缀）及负载/GFI测试
+    _SKIP_PREFIX = ('MSGE',)
+    _SKIP_EXACT = frozenset({'LOAD601', 'GFI10'})
+
+    # 固定的样板行（每次转换都相同，类加载时构建一次）
+    _BLANK_ROW = ('', '', '', '', '', '', '', '')
+
+    _SETUP_ROWS = (
+        ('Test Setup', '', '', '', '', '', '', ''),
+        ('', '', '', 'DUT Information', '', '', '', ''),
+        _BLANK_ROW,
+    )
+
+    _TEMPLATE_INFO_ROWS = (
+        ('JOB Name :', '', '', '', '', '', '', ''),
+        _BLANK_ROW,
+        _BLANK_ROW,
+        ('Template Information', '', '', '', '', '', '', ''),
+        _BLANK_ROW,
+    )
+
+    _AP_HEADER_ROWS = (
+        _BLANK_ROW,
+        _BLANK_ROW,
+        _BLANK_ROW,
+        ('PLC Configuration-Applied part setup', '', '', '', '', '', '', ''),
+        _BLANK_ROW,
+        ('AP Name', 'AP Type', 'AP Num', '', '', '', '', ''),
+    )
+
+    _RESULTS_HEADER_ROWS = (
+        _BLANK_ROW,
+        _BLANK_ROW,
+        _BLANK_ROW,
+        _BLANK_ROW,
+        _BLANK_ROW,
+        ('ESA615 Test Results', '', '', '', '', '', '', ''),
+        _BLANK_ROW,
+        ('Test Name', '', '', '', 'Value', 'High Limits', 'Low Limits', 'Status'),
+        _BLANK_ROW,
+    )
+
+    _SIGNATURE_ROWS = (
+        _BLANK_ROW,
+        _BLANK_ROW,
+        ('', '', '', '', '', '________', '', ''),
+        ('', '', '', '', '', 'Signature', '', ''),
+    )
+
+    def __init__(self, dta_content=None):
+        """
+        dta_content: .dta文本（str）或已打开的文本流（逐行读取，不整体载入）；
+                     为None时用feed()分段输入（如边下载边解析）
+        """
         self.data = dta_content
         self.header = {}
+        self.hdr = None  # parse()后为_DTAHeader
         self.test_results = []
         self.applied_parts = []
-
-    def parse(self):
-        """解析.dta内容"""
-        lines = self.data.split('\n')
-
-        in_header = False
-        in_body = False
-        current_test = {}
+        self._pending = ''  # feed()中尚未遇到换行的残行
+        # 解析状态：in_header, in_body, test_name, is_ap, ap_name, limit, result, status
+        # （test_name为None表示不在测试块内）
+        self._state = (False, False, None, False, '', '', '', '')
+
+    def feed(self, chunk):
+        """流式输入一段.dta文本，完整的行立即解析，不保留原始内容"""
+        lines = (self._pending + chunk).split('\n')
+        self._pending = lines.pop()
+        self._parse_lines(lines)
+
+    def _parse_lines(self, lines):
+        """按行推进解析状态（状态在调用间保存，支持分段输入）"""
+        (in_header, in_body, test_name, is_ap,
+         ap_name, limit, result, status) = self._state
 
         for line in lines:
-            line = line.strip()
-
-            if '<HEADER>' in line:
-                in_header = True
-                continue
-            elif '<\\HEADER>' in line:
-                in_header = False
-                continue
-            elif '<BODY>' in line:
-                in_body = True
-                continue
-            elif '<\\BODY>' in line:
-                in_body = False
-                continue
+            # .dta标签行没有前导空白，只需去掉行尾换行/空格
+            line = line.rstrip()
+
+            # 只有标签行包含'<'，数据行跳过标签检查
+            if '<' in line:
+                if '<HEADER>' in line:
+                    in_header = True
+                    continue
+                elif '<\\HEADER>' in line:
+                    in_header = False
+                    continue
+                elif '<BODY>' in line:
+                    in_body = True
+                    continue
+                elif '<\\BODY>' in line:
+                    in_body = False
+                    continue
 
             # 解析header - 只保留第一次出现（修复operator ID bug）
             if in_header and '=' in line:
-                key, value = line.split('=', 1)
+                key, _, value = line.partition('=')
                 if key not in self.header:
                     self.header[key] = value
 
             # 解析测试数据
             if in_body:
                 if '<TEST=' in line or '<TESTAP=' in line:
-                    if current_test and 'TestName' in current_test:
-                        self.test_results.append(current_test)
+                    if test_name is not None:
+                        self.test_results.append(
+                            DTATest(test_name, ap_name, limit, result, status, is_ap))
 
-                    test_match = re.search(r'<TEST(?:AP)?=(.+?)>', line)
+                    test_match = _TEST_TAG_RE.search(line)
                     if test_match:
-                        current_test = {'TestName': test_match.group(1)}
-                        if '<TESTAP=' in line:
-                            current_test['IsAppliedPart'] = True
+                        test_name = test_match.group(2)
+                        is_ap = bool(test_match.group(1))
+                        ap_name = limit = result = status = ''
+                    else:
+                        test_name = None  # 标签不完整，忽略该测试
 
                 elif '<\\TEST' in line:
-                    if current_test and 'TestName' in current_test:
-                        self.test_results.append(current_test)
-                        current_test = {}
+                    if test_name is not None:
+                        self.test_results.append(
+                            DTATest(test_name, ap_name, limit, result, status, is_ap))
+                        test_name = None
 
-                elif current_test and ',' in line and not line.startswith('<'):
+                elif test_name is not None and ',' in line and not line.startswith('<'):
                     parts = [p.strip() for p in line.split(',')]
                     if len(parts) >= 3:
-                        if current_test.get('IsAppliedPart'):
-                            current_test['APName'] = parts[0]
-                            current_test['Limit'] = parts[1] if len(parts) > 1 else ''
-                            current_test['Result'] = parts[3] if len(parts) > 3 else ''
-                            current_test['Status'] = parts[4] if len(parts) > 4 else ''
+                        if is_ap:
+                            ap_name = parts[0]
+                            limit = parts[1]
+                            result = parts[3] if len(parts) > 3 else ''
+                            status = parts[4] if len(parts) > 4 else ''
                         else:
-                            current_test['Limit'] = parts[0]
-                            current_test['Result'] = parts[2]
-                            current_test['Status'] = parts[3] if len(parts) > 3 else ''
-
-        # 解析Applied Parts
-        ap_names = self.header.get('APNAME', '').split(',')
-        ap_types = self.header.get('APTYPE', '').split(',')
-        ap_nums = self.header.get('NUMAP', '').split(',')
-
-        for i in range(len(ap_names)):
-            if ap_names[i].strip():
-                self.applied_parts.append({
-                    'name': ap_names[i].strip(),
-                    'type': ap_types[i].strip() if i < len(ap_types) else '',
-                    'num': ap_nums[i].strip() if i < len(ap_nums) else ''
-                })
+                            limit = parts[0]
+                            result = parts[2]
+                            status = parts[3] if len(parts) > 3 else ''
+
+        self._state = (in_header, in_body, test_name, is_ap,
+                       ap_name, limit, result, status)
 
+    def parse(self):
+        """解析.dta内容（只解析一次，之后释放原始数据）"""
+        if self.hdr is not None:
+            return self.header, self.test_results
+
+        # 逐行迭代，避免split('\n')再复制一份完整内容
+        if self.data is not None:
+            if isinstance(self.data, str):
+                self._parse_lines(io.StringIO(self.data))
+            else:
+                self._parse_lines(self.data)
+
+        # feed()输入的最后一行（无结尾换行）
+        if self._pending:
+            self._parse_lines((self._pending,))
+            self._pending = ''
+
+        # 解析Applied Parts（类型/数量缺失时补空）
+        for name, typ, num in zip_longest(
+                (p.strip() for p in self.header.get('APNAME', '').split(',')),
+                (p.strip() for p in self.header.get('APTYPE', '').split(',')),
+                (p.strip() for p in self.header.get('NUMAP', '').split(',')),
+                fillvalue=''):
+            if name:
+                self.applied_parts.append({'name': name, 'type': typ, 'num': num})
+
+        self.hdr = _DTAHeader(self.header)
+        self.data = None
         return self.header, self.test_results
 
     def to_csv(self, output_file):
         """转换为CSV - 输出格式完全兼容stable.txt的parse_fluke_file()"""
         self.parse()
-
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Test Setup Header
-            writer.writerow(['Test Setup', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', 'DUT Information', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            # Operator and DUT info (multi-column format - critical for parser compatibility)
-            writer.writerow(['Operator ID :', '', self.header.get('ESA615OPID', ''), '',
-                           'Equipment Number :', '', self.header.get('DUTEQUIPNUM', ''), ''])
-            writer.writerow(['Calibration Tech :', '', self.header.get('ESA615CALTECH', ''), '',
-                           'Serial Number :', '', self.header.get('DUTSN', ''), ''])
-
-            # Calibration Date formatting
-            cal_date = self.header.get('ESA615CALDATE', '')
-            if cal_date.startswith('M') and 'D' in cal_date and 'Y' in cal_date:
-                try:
-                    m = int(cal_date[1:3])
-                    d = int(cal_date[4:6])
-                    y = cal_date[7:11]
-                    cal_date = f"{m}/{d}/{y}"
-                except:
-                    pass
-
-            writer.writerow(['Calibration Date :', '', cal_date, '',
-                           'Manufacturer :', '', self.header.get('DUTMANF', ''), ''])
-            writer.writerow(['Firmware Version :', '', self.header.get('ESA615UIFW', ''), '',
-                           'Model :', '', self.header.get('DUTMODEL', ''), ''])
-            writer.writerow(['Serial Number :', '', self.header.get('ESA615SN', ''), '',
-                           'Location :', '', self.header.get('DUTLOC', ''), ''])
-
-            # Date & Time formatting (critical for parser)
-            date_str = self.header.get('DATEOFTEST', '')
-            time_str = self.header.get('TIMEOFTEST', '')
-            try:
-                date_parts = date_str.split('/')
-                if len(date_parts) == 3:
-                    datetime_str = f"{int(date_parts[1])}/{int(date_parts[2])}/{date_parts[0]} {time_str}"
-                else:
-                    datetime_str = f"{date_str} {time_str}"
-            except:
-                datetime_str = f"{date_str} {time_str}"
-
-            writer.writerow(['Date & Time :', '', datetime_str, '',
-                           'Other :', '', self.header.get('OTHER', ''), ''])
-            writer.writerow(['JOB Name :', '', '', '', '', '', '', ''])
-
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            # Template Information
-            writer.writerow(['Template Information', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            writer.writerow(['Template Name :', '', self.header.get('MASTERFILE', ''), '',
-                           'Standard :', '', self.header.get('STANDARD', ''), ''])
-            writer.writerow(['Pause after Power ON:', '', self.header.get('PAUSEAFTERON', 'NO'), '',
-                           'Pause before Power OFF:', '', self.header.get('PAUSEBEFOREOFF', 'NO'), ''])
-            writer.writerow(['Power ON delay:', '', self.header.get('PONDELAY', '1'), '',
-                           'Power OFF delay:', '', self.header.get('POFFDELAY', '0'), ''])
-            writer.writerow(['Test Speed:', '', self.header.get('TSPEED', 'RAPID'), '',
-                           'Test Mode:', '', self.header.get('TMODE', 'AUTO'), ''])
-            writer.writerow(['Halt on Test Failure:', '', self.header.get('HALTONFAIL', 'YES'), '',
-                           'Multiple PE Test:', '', self.header.get('MULTIPETEST', 'YES'), ''])
-            writer.writerow(['Include Time:', '', self.header.get('INCLUDETIME', 'YES'), '',
-                           'Patient Lead Record:', '', self.header.get('MULTIRESSTORE', 'WORST/LAST'), ''])
-            writer.writerow(['Insulation Resistance Voltage:', '', self.header.get('INSVOLTAGE', '500V'), '',
-                           'Reverse Polarity:', '', self.header.get('REVERSEPOL', 'YES'), ''])
-            writer.writerow(['Multiple Non-Earth Leakage:', '', self.header.get('MULTIENCLTEST', 'YES'), '',
-                           'Classification:', '', self.header.get('CLASSIFICATION', 'I'), ''])
-
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            # Applied part setup
-            writer.writerow(['PLC Configuration-Applied part setup', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['AP Name', 'AP Type', 'AP Num', '', '', '', '', ''])
-
-            for ap in self.applied_parts:
-                writer.writerow([ap['name'], ap['type'], ap['num'], '', '', '', '', ''])
-
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            # ESA615 Test Results
-            writer.writerow(['ESA615 Test Results', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['Test Name', '', '', '', 'Value', 'High Limits', 'Low Limits', 'Status'])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-
-            # 写入测试结果 - 简化版本，保证与stable.txt兼容
-            for test in self.test_results:
-                test_name = test.get('TestName', '')
-                # 跳过消息类测试
-                if 'MSGE' in test_name or test_name in ['LOAD601', 'GFI10']:
-                    continue
-
-                writer.writerow([
-                    test_name, '', '',
-                    test.get('APName', ''),
-                    test.get('Result', ''),
-                    test.get('Limit', ''),
-                    '',
-                    test.get('Status', '')
-                ])
-
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '', '', ''])
-            writer.writerow(['', '', '', '', '', '________', '', ''])
-            writer.writerow(['', '', '', '', '', 'Signature', '', ''])
+        h = self.hdr
+
+        # 先在内存中生成完整CSV，最后一次性编码写入
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        # Test Setup Header
+        writer.writerows(self._SETUP_ROWS)
+
+        # Operator and DUT info (multi-column format - critical for parser compatibility)
+        writer.writerow(['Operator ID :', '', h.ESA615OPID, '',
+                       'Equipment Number :', '', h.DUTEQUIPNUM, ''])
+        writer.writerow(['Calibration Tech :', '', h.ESA615CALTECH, '',
+                       'Serial Number :', '', h.DUTSN, ''])
+
+        # Calibration Date formatting
+        cal_date = _fmt_cal_date(h.ESA615CALDATE)
+
+        writer.writerow(['Calibration Date :', '', cal_date, '',
+                       'Manufacturer :', '', h.DUTMANF, ''])
+        writer.writerow(['Firmware Version :', '', h.ESA615UIFW, '',
+                       'Model :', '', h.DUTMODEL, ''])
+        writer.writerow(['Serial Number :', '', h.ESA615SN, '',
+                       'Location :', '', h.DUTLOC, ''])
+
+        # Date & Time formatting (critical for parser)
+        datetime_str = _fmt_datetime(h.DATEOFTEST, h.TIMEOFTEST)
+
+        writer.writerow(['Date & Time :', '', datetime_str, '',
+                       'Other :', '', h.OTHER, ''])
+
+        # Template Information
+        writer.writerows(self._TEMPLATE_INFO_ROWS)
+
+        writer.writerow(['Template Name :', '', h.MASTERFILE, '',
+                       'Standard :', '', h.STANDARD, ''])
+        writer.writerow(['Pause after Power ON:', '', h.PAUSEAFTERON, '',
+                       'Pause before Power OFF:', '', h.PAUSEBEFOREOFF, ''])
+        writer.writerow(['Power ON delay:', '', h.PONDELAY, '',
+                       'Power OFF delay:', '', h.POFFDELAY, ''])
+        writer.writerow(['Test Speed:', '', h.TSPEED, '',
+                       'Test Mode:', '', h.TMODE, ''])
+        writer.writerow(['Halt on Test Failure:', '', h.HALTONFAIL, '',
+                       'Multiple PE Test:', '', h.MULTIPETEST, ''])
+        writer.writerow(['Include Time:', '', h.INCLUDETIME, '',
+                       'Patient Lead Record:', '', h.MULTIRESSTORE, ''])
+        writer.writerow(['Insulation Resistance Voltage:', '', h.INSVOLTAGE, '',
+                       'Reverse Polarity:', '', h.REVERSEPOL, ''])
+        writer.writerow(['Multiple Non-Earth Leakage:', '', h.MULTIENCLTEST, '',
+                       'Classification:', '', h.CLASSIFICATION, ''])
+
+        # Applied part setup
+        writer.writerows(self._AP_HEADER_ROWS)
+
+        for ap in self.applied_parts:
+            writer.writerow([ap['name'], ap['type'], ap['num'], '', '', '', '', ''])
+
+        # ESA615 Test Results
+        writer.writerows(self._RESULTS_HEADER_ROWS)
+
+        # 写入测试结果 - 简化版本，保证与stable.txt兼容（跳过消息类测试）
+        skip_prefix = self._SKIP_PREFIX
+        skip_exact = self._SKIP_EXACT
+        writer.writerows([
+            [t.name, '', '', t.ap_name, t.result, t.limit, '', t.status]
+            for t in self.test_results
+            if not t.name.startswith(skip_prefix) and t.name not in skip_exact
+        ])
+
+        writer.writerows(self._SIGNATURE_ROWS)
+
+        # utf-8 + BOM（与utf-8-sig相同）
+        with open(output_file, 'wb') as f:
+            f.write(('\ufeff' + buf.getvalue()).encode('utf-8'))
+
+
+def _convert_one(dta_path):
+    """转换单个.dta文件，输出同名.csv，返回CSV路径（供进程池调用）"""
+    csv_path = os.path.splitext(dta_path)[0] + '.csv'
+    with open(dta_path, 'r', encoding='ascii', errors='ignore') as f:
+        DTAtoCSVConverter(f).to_csv(csv_path)
+    return csv_path
+
+
+def convert_many(dta_paths, workers=None):
+    """
+    批量转换.dta文件（每个文件独立，多进程并行）
+
+    Args:
+        dta_paths: .dta文件路径列表
+        workers: 进程数（默认os.cpu_count()）
+
+    Returns: 生成的CSV路径列表（与输入顺序一致）
+    """
+    dta_paths = list(dta_paths)
+    if len(dta_paths) <= 1:
+        return [_convert_one(p) for p in dta_paths]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(_convert_one, dta_paths))
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    if len(sys.argv) < 2:
+        print("Usage: python dta_to_csv_converter.py <file.dta> [more.dta ...]")
+        sys.exit(1)
+
+    for csv_path in convert_many(sys.argv[1:]):
+        print(f"✓ {csv_path}")
@@ -15,15 +15,39 @@ Part of EST Converter V3.3 extension (does not modify core functions).
 import serial
 import time
 
+# 固定命令预先编码（命令格式: CMD\r\n\n）
+_CMD_GETFILE = b"GETFILE\r\n\n"
+_CMD_REMOTE = b"REMOTE\r\n\n"
+_CMD_LOCAL = b"LOCAL\r\n\n"
+_CMD_ANSURON = b"ANSURON\r\n\n"
+_CMD_ANSUROFF = b"ANSUROFF\r\n\n"
+_CMD_GETDIR = b"GETDIR\r\n\n"
+_CMD_IDENT = b"IDENT\r\n\n"
+_CMD_OPENFILE_FMT = b"OPENFILE=%s,R\r\n\n"
+
+_FIXED_COMMANDS = {
+    "GETFILE": _CMD_GETFILE,
+    "REMOTE": _CMD_REMOTE,
+    "LOCAL": _CMD_LOCAL,
+    "ANSURON": _CMD_ANSURON,
+    "ANSUROFF": _CMD_ANSUROFF,
+    "GETDIR": _CMD_GETDIR,
+    "IDENT": _CMD_IDENT,
+}
+
 
 class ESA615Connector:
     """ESA615设备连接器 - 优化速度版本"""
 
-    def __init__(self, port='COM8', baudrate=115200, timeout=1):
+    def __init__(self, port='COM8', baudrate=115200, timeout=0.05,
+                 inter_byte_timeout=0.02):
         self.port = port
         self.baudrate = baudrate
+        # 短读超时：read()在驱动层阻塞，read_response按此粒度循环直到静默窗口结束
         self.timeout = timeout
+        self.inter_byte_timeout = inter_byte_timeout
         self.ser = None
+        self.ident = ""  # connect()握手时取得的IDENT应答
 
     def connect(self):
         """连接到ESA615设备"""
@@ -32,13 +56,33 @@ class ESA615Connector:
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout,
+                inter_byte_timeout=self.inter_byte_timeout,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
                 bytesize=serial.EIGHTBITS,
                 write_timeout=1
             )
-            time.sleep(0.3)
-            return True, f"Connected to {self.port} @ {self.baudrate} baud"
+            # 加大驱动缓冲区（仅Windows支持），长时间下载时设备无需等待读取
+            if hasattr(self.ser, 'set_buffer_size'):
+                self.ser.set_buffer_size(rx_size=1048576, tx_size=65536)
+
+            # 轮询IDENT代替固定等待：设备就绪即返回（最多约0.3s）
+            for _ in range(6):
+                self._send_raw(_CMD_IDENT)
+                response = self.read_response(max_wait=0.05, idle=0.5).strip()
+                if response:
+                    # 前几次未及时应答的IDENT可能稍后才到，会在静默窗口内一并读入：
+                    # 只取第一条，并清空接收缓冲，避免迟到的应答混进下一条命令的回复
+                    self.ident = response.splitlines()[0].strip()
+                    self.ser.reset_input_buffer()
+                    return True, f"Connected to {self.port} @ {self.baudrate} baud"
+
+            self.ser.close()
+            return False, (f"⚠ No response from device on {self.port}!\n"
+                          f"Check:\n"
+                          f"• ESA615 is powered on\n"
+                          f"• Correct port selected (check Device Manager)\n"
+                          f"• Baud rate is {self.baudrate}")
         except PermissionError:
             return False, (f"⚠ Port {self.port} access denied!\n"
                           f"Solutions:\n"
@@ -56,35 +100,49 @@ class ESA615Connector:
         except Exception as e:
             return False, f"Connection failed: {e}"
 
+    def _send_raw(self, data):
+        """发送已编码的命令字节（不flush：write已交给驱动发送，设备收到完整命令才应答）"""
+        self.ser.write(data)
+
     def send_command(self, cmd, wait_time=0.1):
-        """发送命令 - 优化速度"""
+        """发送命令 - 固定命令使用预编码字节，动态命令（如OPENFILE=...）才现场编码"""
         if self.ser and self.ser.is_open:
-            command = f"{cmd}\r\n\n".encode('ascii')
-            self.ser.write(command)
-            self.ser.flush()
+            command = _FIXED_COMMANDS.get(cmd)
+            if command is None:
+                command = f"{cmd}\r\n\n".encode('ascii')
+            self._send_raw(command)
             if wait_time > 0:
                 time.sleep(wait_time)
 
-    def read_response(self, max_wait=0.5):
-        """读取响应 - 优化速度"""
-        response = b""
-        start_time = time.time()
+    def read_response(self, max_wait=0.5, idle=None):
+        """读取响应 - 在串口驱动中阻塞等待，无Python轮询
 
-        while (time.time() - start_time) < max_wait:
-            if self.ser.in_waiting > 0:
-                chunk = self.ser.read(self.ser.in_waiting)
-                response += chunk
-                start_time = time.time()
-            else:
-                time.sleep(0.01)
+        max_wait: 最多等待首字节的时间
+        idle: 收到数据后连续idle秒无新字节即视为应答结束（默认与max_wait相同）
+        """
+        if idle is None:
+            idle = max_wait
+        response = bytearray()  # bytes +=会每次复制全部已收数据
+        deadline = time.monotonic() + max_wait
+
+        while True:
+            chunk = self.ser.read(4096)
+            if chunk:
+                response.extend(chunk)
+                # 设备中途停顿不算结束：每收到数据都重新计算静默窗口
+                deadline = time.monotonic() + idle
+            elif time.monotonic() >= deadline:
+                break
 
         return response.decode('ascii', errors='ignore')
 
     def identify_device(self):
-        """识别设备"""
+        """识别设备（优先使用connect()握手时的应答）"""
+        if self.ident:
+            return self.ident
         self.send_command("IDENT", wait_time=0.1)
-        response = self.read_response(max_wait=0.5)
-        return response.strip()
+        self.ident = self.read_response(max_wait=0.5).strip()
+        return self.ident
 
     def enter_remote_mode(self):
         """进入远程模式"""
@@ -111,30 +169,39 @@ class ESA615Connector:
 
         return files
 
-    def download_file(self, filename):
-        """下载文件 - 优化速度（3-5x faster）"""
-        self.send_command(f"OPENFILE={filename},R", wait_time=0.1)
-        self.read_response(max_wait=0.3)
-
-        full_content = ""
-        chunk_count = 0
+    def download_file_iter(self, filename, max_wait=1.0, idle=0.3):
+        """下载文件（生成器）- 阻塞读取GETFILE应答，每收到一个完整应答即yield一段文本，
+        调用方可边下载边处理。应答在idle秒静默后视为结束；设备在max_wait内无应答
+        则抛出TimeoutError（不返回残缺文件）"""
+        # read_response阻塞等待首字节，无需先sleep（原0.1s等待计入max_wait）
+        self._send_raw(_CMD_OPENFILE_FMT % filename.encode('ascii'))
+        self.read_response(max_wait=0.4, idle=0.3)
 
+        # GETFILE应答没有逐条的结束标记，只能靠读超时（静默）分帧，
+        # 因此无法流水线发送：每收到一个完整应答才发送下一个GETFILE
         while True:
-            self.send_command("GETFILE", wait_time=0.05)
-            response = self.read_response(max_wait=0.3)
+            self._send_raw(_CMD_GETFILE)
+            reply = self.read_response(max_wait=max_wait, idle=idle)
+            if not reply:
+                raise TimeoutError(f"ESA615 stopped responding while downloading {filename}")
 
-            if response.strip() == "*":
+            if reply.strip() == "*":
                 break
+            data = reply.rstrip("\r\n")
+            if data.endswith("\r\n*"):  # 数据与结束标记在同一段内到达
+                yield data[:-1]
+                break
+            yield reply
 
-            full_content += response
-            chunk_count += 1
-
-            if chunk_count % 10 == 0:
-                time.sleep(0.05)
+        # 清空输入缓冲：不让迟到的应答混入下一条命令的应答
+        self.ser.reset_input_buffer()
 
-        return full_content
+    def download_file(self, filename, max_wait=1.0, idle=0.3):
+        """下载文件 - 返回完整文本"""
+        return "".join(self.download_file_iter(filename, max_wait, idle))
 
     def disconnect(self):
         """断开连接"""
         if self.ser and self.ser.is_open:
+            self.ser.flush()  # 确保LOCAL等最后的命令在关闭端口前发出
             self.ser.close()
@@ -17,24 +17,50 @@ from PySide6.QtWidgets import (
     QLabel, QListWidget, QListWidgetItem,
     QCheckBox, QComboBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, Signal, QSettings, QMutex, QMutexLocker, QTimer
+from serial.tools import list_ports
 import os
+from concurrent.futures import ThreadPoolExecutor
 from esa615_connector import ESA615Connector
 from dta_to_csv_converter import DTAtoCSVConverter
 
 
 class ESA615DownloadThread(QThread):
-    """后台下载线程"""
-    progress = Signal(str)
+    """后台下载线程（进度消息由GUI线程定时取走，不逐条跨线程发信号）"""
     finished = Signal(bool, str, list)
 
     def __init__(self, port, selected_files, output_dir):
         super().__init__()
         self.port = port
-        self.selected_files = selected_files
+        # 按文件名排序并去重：与设备文件系统顺序一致，顺序读取
+        self.selected_files = sorted(set(selected_files))
         self.output_dir = output_dir
+        self._progress_lock = QMutex()
+        self._progress_msgs = []
+
+        duplicates = len(selected_files) - len(self.selected_files)
+        if duplicates:
+            self._progress(f"Skipped {duplicates} duplicate file(s)")
+
+    def _progress(self, msg):
+        """记录一条进度消息（下载线程/写线程调用）"""
+        with QMutexLocker(self._progress_lock):
+            self._progress_msgs.append(msg)
+
+    def take_progress(self):
+        """取走累积的进度消息（GUI线程调用）"""
+        with QMutexLocker(self._progress_lock):
+            msgs, self._progress_msgs = self._progress_msgs, []
+        return msgs
+
+    def _write_csv(self, converter, csv_path):
+        """写线程：生成CSV"""
+        converter.to_csv(csv_path)
+        self._progress(f"✓ {os.path.basename(csv_path)}")
+        return csv_path
 
     def run(self):
+        conn = None
         try:
             conn = ESA615Connector(self.port, 115200)
 
@@ -43,38 +69,47 @@ class ESA615DownloadThread(QThread):
                 self.finished.emit(False, msg, [])
                 return
 
-            self.progress.emit(f"✓ {msg}")
+            self._progress(f"✓ {msg}")
 
             device_info = conn.identify_device()
-            self.progress.emit(f"Device: {device_info}")
+            self._progress(f"Device: {device_info}")
 
             conn.enter_remote_mode()
-            self.progress.emit("✓ Remote mode")
+            self._progress("✓ Remote mode")
 
-            downloaded = []
             total = len(self.selected_files)
 
-            for i, filename in enumerate(self.selected_files):
-                self.progress.emit(f"[{i+1}/{total}] {filename}")
+            # 两级流水线：串口下载（I/O等待）在本线程，CSV写出在写线程，
+            # 第i个文件写CSV时第i+1个文件已在下载
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = []
+                for i, filename in enumerate(self.selected_files):
+                    self._progress(f"[{i+1}/{total}] {filename}")
 
-                dta_content = conn.download_file(filename)
+                    # 边下载边解析，不在内存中保留完整的.dta文本
+                    converter = DTAtoCSVConverter()
+                    for chunk in conn.download_file_iter(filename):
+                        converter.feed(chunk)
 
-                csv_filename = filename.replace('.dta', '.csv')
-                csv_path = os.path.join(self.output_dir, csv_filename)
+                    csv_filename = filename.replace('.dta', '.csv')
+                    csv_path = os.path.join(self.output_dir, csv_filename)
+                    pending.append(writer.submit(self._write_csv, converter, csv_path))
 
-                converter = DTAtoCSVConverter(dta_content)
-                converter.to_csv(csv_path)
+                conn.exit_remote_mode()
+                conn.disconnect()
 
-                downloaded.append(csv_path)
-                self.progress.emit(f"✓ {csv_filename}")
-
-            conn.exit_remote_mode()
-            conn.disconnect()
-            self.progress.emit("✓ Disconnected")
+            downloaded = [f.result() for f in pending]
+            self._progress("✓ Disconnected")
 
             self.finished.emit(True, f"Downloaded {len(downloaded)} files", downloaded)
 
         except Exception as e:
+            # 下载中断（如设备无应答）：不转换残缺数据，释放串口以便重试
+            if conn is not None:
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
             self.finished.emit(False, str(e), [])
 
 
@@ -88,6 +123,12 @@ class ESA615Widget(QWidget):
         self.log = log_callback
         self.download_thread = None
         self.device_files = []
+        self._checkboxes = []  # 与file_list行一一对应的勾选框
+
+        # 下载进度：约30Hz批量取出线程消息写入日志
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self.drain_progress)
 
         self.init_ui()
 
@@ -98,13 +139,17 @@ class ESA615Widget(QWidget):
         # 顶部：连接状态 + 操作按钮
         top_row = QHBoxLayout()
 
-        # COM端口选择（隐藏显示，默认COM8）
+        # COM端口选择（列出实际存在的串口，记住上次成功连接的端口，默认COM8）
+        self.settings = QSettings()
         self.port_combo = QComboBox()
-        self.port_combo.addItems(['COM1', 'COM2', 'COM3', 'COM4', 'COM5',
-                                  'COM6', 'COM7', 'COM8', 'COM9', 'COM10'])
-        self.port_combo.setCurrentText('COM8')
         self.port_combo.setMaximumWidth(80)
 
+        self.btn_ports = QPushButton("🔄")
+        self.btn_ports.setFixedWidth(32)
+        self.btn_ports.setToolTip("Rescan serial ports")
+        self.btn_ports.clicked.connect(self.refresh_ports)
+        self.refresh_ports()
+
         # 状态指示灯
         self.status_indicator = QLabel("●")
         self.status_indicator.setStyleSheet("color: gray; font-size: 20pt;")
@@ -158,6 +203,7 @@ class ESA615Widget(QWidget):
 
         top_row.addWidget(QLabel("Port:"))
         top_row.addWidget(self.port_combo)
+        top_row.addWidget(self.btn_ports)
         top_row.addWidget(self.status_indicator)
         top_row.addWidget(self.status_label)
         top_row.addStretch()
@@ -301,6 +347,18 @@ class ESA615Widget(QWidget):
         self.setLayout(layout)
         self.connected = False
 
+    def refresh_ports(self):
+        """重新枚举串口（保留当前/上次使用的端口，即使当前未检测到）"""
+        current = self.port_combo.currentText() or self.settings.value("esa615_port", "COM8")
+        ports = sorted((p.device for p in list_ports.comports()),
+                       key=lambda d: (len(d), d))  # COM2排在COM10之前
+        if current not in ports:
+            ports.append(current)
+
+        self.port_combo.clear()
+        self.port_combo.addItems(ports)
+        self.port_combo.setCurrentText(current)
+
     def toggle_connection(self):
         """连接/断开ESA615"""
         if not self.connected:
@@ -318,6 +376,7 @@ class ESA615Widget(QWidget):
             success, msg = self.conn.connect()
 
             if success:
+                self.settings.setValue("esa615_port", port)
                 device_info = self.conn.identify_device()
                 self.log(f"✓ {msg}")
                 self.log(f"Device: {device_info}")
@@ -369,16 +428,25 @@ class ESA615Widget(QWidget):
             self.device_files = self.conn.get_file_list()
             self.conn.exit_remote_mode()
 
-            self.file_list.clear()
+            # 批量填充：暂停重绘和信号，结束后只刷新一次（避免每项重新布局）
+            self.file_list.setUpdatesEnabled(False)
+            self.file_list.blockSignals(True)
+            try:
+                self.file_list.clear()
+                self._checkboxes.clear()
 
-            for filename in self.device_files:
-                item = QListWidgetItem()
+                for filename in self.device_files:
+                    item = QListWidgetItem()
 
-                checkbox = QCheckBox(filename)
-                checkbox.setStyleSheet("font-family: 'Consolas'; padding: 4px;")
+                    checkbox = QCheckBox(filename)
+                    checkbox.setStyleSheet("font-family: 'Consolas'; padding: 4px;")
 
-                self.file_list.addItem(item)
-                self.file_list.setItemWidget(item, checkbox)
+                    self.file_list.addItem(item)
+                    self.file_list.setItemWidget(item, checkbox)
+                    self._checkboxes.append(checkbox)
+            finally:
+                self.file_list.blockSignals(False)
+                self.file_list.setUpdatesEnabled(True)
 
             self.file_count_label.setText(f"Files: {len(self.device_files)}")
             self.log(f"✓ Found {len(self.device_files)} test files")
@@ -388,31 +456,21 @@ class ESA615Widget(QWidget):
 
     def select_all(self):
         """全选"""
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            widget = self.file_list.itemWidget(item)
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(True)
+        for cb in self._checkboxes:
+            cb.setChecked(True)
 
     def deselect_all(self):
         """取消全选"""
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            widget = self.file_list.itemWidget(item)
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(False)
+        for cb in self._checkboxes:
+            cb.setChecked(False)
 
     def delete_selected(self):
         """删除选中的列表项（仅UI，不删除设备文件）"""
-        items_to_remove = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            widget = self.file_list.itemWidget(item)
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                items_to_remove.append(i)
+        items_to_remove = [i for i, cb in enumerate(self._checkboxes) if cb.isChecked()]
 
         for i in reversed(items_to_remove):
             self.file_list.takeItem(i)
+            del self._checkboxes[i]
 
         self.file_count_label.setText(f"Files: {self.file_list.count()}")
         self.log(f"Removed {len(items_to_remove)} items from list")
@@ -423,12 +481,7 @@ class ESA615Widget(QWidget):
             self.log("✗ Not connected to device")
             return
 
-        selected = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            widget = self.file_list.itemWidget(item)
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                selected.append(widget.text())
+        selected = [cb.text() for cb in self._checkboxes if cb.isChecked()]
 
         if not selected:
             self.log("✗ No files selected")
@@ -443,12 +496,20 @@ class ESA615Widget(QWidget):
             self.output_dir
         )
 
-        self.download_thread.progress.connect(self.log)
         self.download_thread.finished.connect(self.on_download_finished)
         self.download_thread.start()
+        self.progress_timer.start()
+
+    def drain_progress(self):
+        """把下载线程累积的进度消息写入日志"""
+        if self.download_thread is not None:
+            for msg in self.download_thread.take_progress():
+                self.log(msg)
 
     def on_download_finished(self, success, message, csv_files):
         """下载完成"""
+        self.progress_timer.stop()
+        self.drain_progress()
         self.btn_download.setEnabled(True)
 
         if success:
@@ -0,0 +1,1286 @@
+#!/usr/bin/env python3
+"""
+EST Converter Core V3.3
+
+Conversion logic for est_converter.py (Fluke ESA615 CSV -> InterfaceTransactions
+XLSX). This module does not import PySide6: conversion worker processes only
+import this module, so they start without loading Qt.
+
+Architecture:
+    1. Pure Rules Layer - Standard/ClassType inference, limits, canonicalization
+    2. Parsing Layer - CSV → FlukeParsed model
+    3. Mapping Layer - FlukeParsed → InterfaceRow
+    4. Output Layer - Append to template XLSX
+    5. Conversion Orchestration - convert_files()
+
+Core Promises (DO NOT MODIFY without regression proof):
+    - parse_fluke_file()
+    - build_interface_row()
+    - load_fixed_limits_from_summary() / get_fixed_limit_for_field()
+    - append_rows_to_template()
+"""
+
+import sys
+import os
+import csv
+import io
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+
+from dateutil import parser as date_parser
+
+
+def load_workbook(*args, **kwargs):
+    """openpyxl.load_workbook, imported on first use (keeps ~130 ms off startup)."""
+    from openpyxl import load_workbook as _load_workbook
+    return _load_workbook(*args, **kwargs)
+
+
+def get_app_dir() -> str:
+    """
+    Directory holding the template files.
+
+    Source runs use the script directory. Frozen (PyInstaller) builds use the
+    folder containing the EXE, since templates ship alongside it rather than
+    inside the bundle.
+    """
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+# ============================================================================
+# SECTION 1: DATA MODELS
+# ============================================================================
+
+@dataclass
+class Measurement:
+    """Single measurement from Fluke CSV."""
+    __slots__ = ("group", "cond", "subtest", "value", "pf")  # No per-row __dict__
+
+    group: str          # Canonical group (G_PROT_EARTH_RES, etc.)
+    cond: str           # Normalized condition (NORMAL CONDITION, OPEN NEUTRAL, OPEN EARTH)
+    subtest: str        # Original test name
+    value: float        # Cleaned numeric value
+    pf: str             # Pass/Fail status
+
+
+@dataclass
+class FlukeParsed:
+    """Parsed Fluke CSV file data."""
+    operator: str
+    equipment: str
+    tester_sn: str
+    template: str
+    dt: datetime
+    measurements: List[Measurement] = field(default_factory=list)
+
+
+@dataclass
+class InterfaceRow:
+    """Output row for InterfaceTransactions XLSX (22 columns)."""
+    operator: str = ""
+    equipment_number: str = ""
+    asset_number: str = ""
+    standard: str = ""
+    test_type: str = ""
+    class_type: str = ""
+    test_seq: str = ""
+    test_date: str = ""
+    visual_pass_fail: str = ""
+    line_load: str = "NA"
+    earth_bond: str = "NA"
+    insulation: str = "NA"
+    earth_leakage_nc: str = "NA"
+    earth_leakage_no: str = "NA"
+    enclosure_leakage_nc: str = "NA"
+    enclosure_leakage_no: str = "NA"
+    enclosure_leakage_eo: str = "NA"
+    applied_part_leakage_nc: str = "NA"
+    applied_part_leakage_no: str = "NA"
+    applied_part_leakage_eo: str = "NA"
+    mains_contact: str = "NA"
+    overall_pass_fail: str = "P"
+
+    def to_tuple(self) -> tuple:
+        """Return the 22 column values in output (write) order."""
+        return (
+            self.operator,
+            self.equipment_number,
+            self.asset_number,
+            self.standard,
+            self.test_type,
+            self.class_type,
+            self.test_seq,
+            self.test_date,
+            self.visual_pass_fail,
+            self.line_load,
+            self.earth_bond,
+            self.insulation,
+            self.earth_leakage_nc,
+            self.earth_leakage_no,
+            self.enclosure_leakage_nc,
+            self.enclosure_leakage_no,
+            self.enclosure_leakage_eo,
+            self.applied_part_leakage_nc,
+            self.applied_part_leakage_no,
+            self.applied_part_leakage_eo,
+            self.mains_contact,
+            self.overall_pass_fail,
+        )
+
+
+# ============================================================================
+# SECTION 2: PURE RULES LAYER
+# ============================================================================
+
+# Canonical group constants
+G_PROT_EARTH_RES = "G_PROT_EARTH_RES"
+G_MAINS_V_LN = "G_MAINS_V_LN"
+G_MAINS_V_NE = "G_MAINS_V_NE"
+G_INSULATION = "G_INSULATION"
+G_EARTH_LEAK = "G_EARTH_LEAK"
+G_ENC_LEAK = "G_ENC_LEAK"
+G_PATIENT_LEAK = "G_PATIENT_LEAK"
+G_MAINS_ON_AP = "G_MAINS_ON_AP"
+
+# Normalized conditions
+COND_NC = "NORMAL CONDITION"
+COND_NO = "OPEN NEUTRAL"
+COND_EO = "OPEN EARTH"
+
+
+# Group rules compiled into one anchored regex. Alternatives are tried in
+# order and each is a set of lookaheads over the whole string, so the first
+# rule whose keywords all appear wins (same priority as the original if-chain).
+_GROUP_RE = re.compile(
+    r"^(?:"
+    r"(?P<G_PROT_EARTH_RES>(?=.*(?:PROTECTIVE EARTH|EARTH BOND|EARTH CONTINUITY)))"
+    r"|(?P<G_MAINS_V_LN>(?=.*MAINS)(?=.*L-?N)(?=.*VOLTAGE))"
+    r"|(?P<G_MAINS_V_NE>(?=.*MAINS)(?=.*N-?E)(?=.*VOLTAGE))"
+    r"|(?P<G_INSULATION>(?=.*INSULATION))"
+    r"|(?P<G_EARTH_LEAK>(?=.*EARTH)(?=.*LEAKAGE)(?!.*ENCLOSURE))"
+    r"|(?P<G_ENC_LEAK>(?=.*ENCLOSURE)(?=.*LEAKAGE))"
+    r"|(?P<G_PATIENT_LEAK>(?=.*(?:PATIENT|APPLIED PART))(?=.*LEAKAGE))"
+    r"|(?P<G_MAINS_ON_AP>(?=.*MAINS)(?=.*(?:APPLIED|PATIENT))(?=.*(?:CONTACT|ON)))"
+    r")",
+    re.DOTALL,
+)
+
+_GROUP_MAP = {
+    "G_PROT_EARTH_RES": G_PROT_EARTH_RES,  # Earth bond / protective earth resistance
+    "G_MAINS_V_LN": G_MAINS_V_LN,          # Mains voltage L-N
+    "G_MAINS_V_NE": G_MAINS_V_NE,          # Mains voltage N-E
+    "G_INSULATION": G_INSULATION,          # Insulation
+    "G_EARTH_LEAK": G_EARTH_LEAK,          # Earth leakage (not enclosure)
+    "G_ENC_LEAK": G_ENC_LEAK,              # Enclosure leakage
+    "G_PATIENT_LEAK": G_PATIENT_LEAK,      # Patient / applied part leakage
+    "G_MAINS_ON_AP": G_MAINS_ON_AP,        # Mains on applied parts
+}
+
+# Open neutral is checked before open earth anywhere in the string
+_COND_RE = re.compile(
+    r"^(?:(?P<NO>(?=.*(?:OPEN N|O/N)))|(?P<EO>(?=.*(?:OPEN E|O/E))))",
+    re.DOTALL,
+)
+
+_COND_MAP = {"NO": COND_NO, "EO": COND_EO}
+
+
+@lru_cache(maxsize=1024)
+def canonical_group(raw_group: str) -> Optional[str]:
+    """
+    Normalize raw Fluke group name to canonical key.
+
+    Returns canonical group constant or None if unrecognized.
+    """
+    m = _GROUP_RE.match(raw_group.upper())
+    if m:
+        return _GROUP_MAP[m.lastgroup]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def normalize_condition(raw_cond: str) -> str:
+    """
+    Normalize condition string.
+
+    Returns one of: NORMAL CONDITION, OPEN NEUTRAL, OPEN EARTH
+    """
+    m = _COND_RE.match(raw_cond.upper())
+    if m:
+        return _COND_MAP[m.lastgroup]
+    return COND_NC
+
+
+# Template name tokenizer and combined class token (e.g. "1D", "2BF")
+_TOKEN_RE = re.compile(r'\w+')
+_BASE_CLASS_RE = re.compile(r'^[125][A-Z]+$')
+
+# Template tokens used by the standard / class type rules
+_TOK_3760 = frozenset({"1D", "2D", "5D"})
+_TOK_3551 = frozenset({"5B", "5BF", "5CF", "5C"})
+_TYPE_TOKS = frozenset({"BF", "CF", "B"})
+_BASE_CLASS_DIGITS = frozenset({"1", "2", "5"})
+
+
+@lru_cache(maxsize=1024)
+def infer_standard(template_name: str) -> Optional[str]:
+    """
+    Infer AS/NZS standard from template name.
+
+    Rules (in order):
+        1. Contains "3760" → AS/NZS 3760
+        2. Contains "3551" → AS/NZS 3551
+        3. "NO EARTH" + "DOMESTIC" → AS/NZS 3760
+        4. "NO EARTH" (non-domestic) → AS/NZS 3551
+        5. Token "1D/2D/5D" → AS/NZS 3760
+        6. Token "5B/5BF/5CF/5C" or "TYPE BF/CF/B" → AS/NZS 3551
+        7. Else → None (inference failed)
+
+    Returns: "AS/NZS 3551" or "AS/NZS 3760" or None
+    """
+    upper = template_name.upper()
+    return _infer_standard(upper, _TOKEN_RE.findall(upper))
+
+
+def _infer_standard(upper: str, tokens: List[str]) -> Optional[str]:
+    """infer_standard() rules on an upper-cased, pre-tokenized template name."""
+    token_set = set(tokens)
+
+    # Rule 1: Explicit 3760
+    if "3760" in upper:
+        return "AS/NZS 3760"
+
+    # Rule 2: Explicit 3551
+    if "3551" in upper:
+        return "AS/NZS 3551"
+
+    # Rule 3: NO EARTH + DOMESTIC
+    if "NO EARTH" in upper and "DOMESTIC" in upper:
+        return "AS/NZS 3760"
+
+    # Rule 4: NO EARTH (non-domestic)
+    if "NO EARTH" in upper:
+        return "AS/NZS 3551"
+
+    # Rule 5: Tokens indicating 3760
+    if _TOK_3760 & token_set:
+        return "AS/NZS 3760"
+
+    # Rule 6: Tokens indicating 3551
+    if _TOK_3551 & token_set or ("TYPE" in upper and _TYPE_TOKS & token_set):
+        return "AS/NZS 3551"
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def infer_class_type(template_name: str, standard: str) -> str:
+    """
+    Infer ClassType from template name and standard.
+
+    Args:
+        template_name: Original template name from CSV
+        standard: Inferred standard (AS/NZS 3551 or AS/NZS 3760)
+
+    Returns: ClassType string (e.g., "1D", "5BF", "5CF&5BF", etc.)
+    """
+    upper = template_name.upper()
+    return _infer_class_type(upper, _TOKEN_RE.findall(upper), standard)
+
+
+def _infer_class_type(upper: str, tokens: List[str], standard: str) -> str:
+    """infer_class_type() rules on an upper-cased, pre-tokenized template name."""
+    token_set = set(tokens)
+
+    # NO EARTH cases
+    if "NO EARTH" in upper:
+        # NO EARTH DOMESTIC → 5D
+        if "DOMESTIC" in upper:
+            return "5D"
+
+        # NO EARTH + (5CF & (5BF or BF)) → 5CF&5BF
+        has_5cf = "5CF" in token_set
+        has_bf = "5BF" in token_set or "BF" in token_set
+        if has_5cf and has_bf:
+            return "5CF&5BF"
+
+        # NO EARTH + NO AP → 5
+        if "NO AP" in upper or "NO APPLIED" in upper:
+            return "5"
+
+        # NO EARTH + TYPE CF → 5CF
+        if "TYPE CF" in upper or "CF" in token_set:
+            return "5CF"
+
+        # NO EARTH + TYPE BF → 5BF
+        if "TYPE BF" in upper or "BF" in token_set:
+            return "5BF"
+
+        # NO EARTH + TYPE B → 5B
+        if "TYPE B" in upper or "B" in token_set:
+            return "5B"
+
+        # Default NO EARTH
+        return "5"
+
+    # Earthed cases
+    # Extract base class number (1, 2, 5, etc.)
+    base_class = None
+    for token in tokens:
+        if token in _BASE_CLASS_DIGITS:
+            base_class = token
+            break
+        # Check for combined tokens like "1D", "2D"
+        if _BASE_CLASS_RE.match(token):
+            base_class = token[0]
+            break
+
+    if base_class is None:
+        base_class = "1"  # Default
+
+    if standard == "AS/NZS 3760":
+        return f"{base_class}D"
+
+    # 3551 earthed - check for type
+    if "TYPE CF" in upper or "CF" in token_set:
+        return f"{base_class}CF"
+    if "TYPE BF" in upper or "BF" in token_set:
+        return f"{base_class}BF"
+    if "TYPE B" in upper:
+        return f"{base_class}B"
+
+    # Default 3551 earthed
+    return f"{base_class}BF"
+
+
+@lru_cache(maxsize=1024)
+def _classify_template(template_name: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Infer (standard, class_type) from a template name with one tokenization.
+
+    Returns: (standard, class_type), or (None, None) if the standard
+    cannot be inferred.
+    """
+    upper = template_name.upper()
+    tokens = _TOKEN_RE.findall(upper)
+    standard = _infer_standard(upper, tokens)
+    if standard is None:
+        return None, None
+    return standard, _infer_class_type(upper, tokens, standard)
+
+
+@lru_cache(maxsize=1024)
+def class_is_earthed(class_type: str, standard: str) -> bool:
+    """
+    Determine if class type requires earth bond.
+
+    Args:
+        class_type: Class type string
+        standard: AS/NZS standard
+
+    Returns: True if earthed class, False otherwise
+    """
+    # NO EARTH classes
+    if class_type.startswith("5") and standard == "AS/NZS 3551":
+        return False
+
+    return True
+
+
+# Default fixed limits (fallback if EST_Limits_Summary.xlsx not found)
+DEFAULT_LIMITS_3551 = {
+    "earth_bond": "0.2",
+    "insulation": "1.0",
+    "earth_leakage_nc": "5000",
+    "earth_leakage_no": "5000",
+    "enclosure_leakage_nc": "500",
+    "enclosure_leakage_no": "500",
+    "enclosure_leakage_eo": "500",
+    "patient_leakage_nc": "500",
+    "patient_leakage_no": "500",
+    "patient_leakage_eo": "500",
+    "mains_contact": "25000",
+}
+
+DEFAULT_LIMITS_3760 = {
+    "earth_bond": "1",
+    "insulation": "1.0",
+    "earth_leakage_nc": "5000",
+    "earth_leakage_no": "5000",
+    "enclosure_leakage_nc": "1000",  # Class 2
+    "enclosure_leakage_no": "1000",
+    "enclosure_leakage_eo": "1000",
+    # Patient leakage / mains on AP → NA for 3760 baseline
+}
+
+
+def get_default_limits(standard: str, class_type: str) -> Dict[str, str]:
+    """
+    Get default limits for given standard and class type.
+
+    Args:
+        standard: AS/NZS standard
+        class_type: Class type
+
+    Returns: Dictionary of field → limit value
+    """
+    if standard == "AS/NZS 3760":
+        return DEFAULT_LIMITS_3760.copy()
+    else:
+        return DEFAULT_LIMITS_3551.copy()
+
+
+def _cellstr(value) -> str:
+    """Stripped text of a cell value; "" for empty/falsy cells (None, "", 0)."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
+# Global limits cache (loaded from EST_Limits_Summary.xlsx)
+_LIMITS_CACHE: Dict[str, Dict[str, str]] = {}
+
+
+def load_fixed_limits_from_summary(summary_path: str = "EST_Limits_Summary.xlsx"):
+    """
+    Load fixed limits from EST_Limits_Summary.xlsx.
+
+    Expected structure:
+        Sheet: Summary or first sheet
+        Columns: Standard, ClassType, Field, Limit
+
+    Populates global _LIMITS_CACHE.
+    """
+    # If relative path, look in application directory
+    if not os.path.isabs(summary_path):
+        summary_path = os.path.join(get_app_dir(), summary_path)
+
+    global _LIMITS_CACHE
+    _LIMITS_CACHE = {}
+    _limits_for.cache_clear()
+
+    if not os.path.exists(summary_path):
+        print(f"Warning: {summary_path} not found, using default limits")
+        return
+
+    try:
+        # Read-only mode streams rows instead of building the whole workbook
+        wb = load_workbook(summary_path, data_only=True, read_only=True)
+        try:
+            if "Summary" in wb.sheetnames:
+                ws = wb["Summary"]
+            else:
+                ws = wb.active
+
+            # Single pass: find header row (within first 10 rows), then data rows
+            header_found = False
+            for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+                if not header_found:
+                    if row and "Standard" in str(row) and "Field" in str(row):
+                        header_found = True
+                    elif row_idx >= 10:
+                        break
+                    continue
+
+                if not row or not row[0]:
+                    continue
+
+                standard = _cellstr(row[0])
+                class_type = _cellstr(row[1]) if len(row) > 1 else ""
+                field = _cellstr(row[2]).lower() if len(row) > 2 else ""
+                limit = _cellstr(row[3]) if len(row) > 3 else ""
+
+                if not standard or not field or not limit:
+                    continue
+
+                key = f"{standard}|{class_type}|{field}"
+                _LIMITS_CACHE[key] = limit
+        finally:
+            wb.close()
+
+        if not header_found:
+            print("Warning: Could not find header in limits summary")
+            return
+
+        print(f"Loaded {len(_LIMITS_CACHE)} limits from {summary_path}")
+
+    except Exception as e:
+        print(f"Error loading limits summary: {e}")
+
+
+def get_fixed_limit_for_field(standard: str, class_type: str, field: str) -> str:
+    """
+    Get fixed limit for a specific field.
+
+    Args:
+        standard: AS/NZS standard
+        class_type: Class type
+        field: Field name (e.g., "earth_bond", "insulation")
+
+    Returns: Limit value as string
+    """
+    # Try exact match
+    key = f"{standard}|{class_type}|{field}"
+    if key in _LIMITS_CACHE:
+        return _LIMITS_CACHE[key]
+
+    # Try without class type (generic for standard)
+    key = f"{standard}||{field}"
+    if key in _LIMITS_CACHE:
+        return _LIMITS_CACHE[key]
+
+    # Fallback to defaults
+    defaults = get_default_limits(standard, class_type)
+    return defaults.get(field, "")
+
+
+# Fields with a fixed limit in the output row
+_LIMIT_FIELDS = (
+    "earth_bond",
+    "insulation",
+    "earth_leakage_nc",
+    "earth_leakage_no",
+    "enclosure_leakage_nc",
+    "enclosure_leakage_no",
+    "enclosure_leakage_eo",
+    "patient_leakage_nc",
+    "patient_leakage_no",
+    "patient_leakage_eo",
+    "mains_contact",
+)
+
+
+@lru_cache(maxsize=32)
+def _limits_for(standard: str, class_type: str) -> Dict[str, str]:
+    """
+    Resolve all fixed limits for a standard/class type pair at once.
+
+    Cached per pair; cleared whenever the limits summary is reloaded.
+
+    Returns: Dictionary of field → limit value (do not modify)
+    """
+    return {f: get_fixed_limit_for_field(standard, class_type, f) for f in _LIMIT_FIELDS}
+
+
+# ============================================================================
+# SECTION 3: PARSING LAYER
+# ============================================================================
+
+# Units, whitespace and comparison symbols stripped from Fluke value strings.
+# Deletion table for str.translate: ASCII letters, "><=" and every Unicode
+# whitespace character (all at or below U+3000), same set as [A-Za-z\s><=]
+_CLEAN_VALUE_TABLE = str.maketrans('', '', (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz><="
+    + "".join(chr(c) for c in range(0x3001) if chr(c).isspace())
+))
+
+
+def clean_value(value_str: str) -> Optional[float]:
+    """
+    Extract numeric value from Fluke value string.
+
+    Examples:
+        "0.15 Ohm" → 0.15
+        "1.2" → 1.2
+        "> 1000 MOhm" → 1000.0
+
+    Returns: Float value or None if parsing fails
+    """
+    if not value_str:
+        return None
+
+    # Remove common units and symbols
+    cleaned = value_str.translate(_CLEAN_VALUE_TABLE)
+    if not cleaned:  # Text-only readings ("OPEN", "Ohm"): skip the float() exception
+        return None
+
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+# Results header keywords for the value and pass/fail status columns
+_VALUE_HEADER_KEYS = ("VALUE", "RESULT")
+_STATUS_HEADER_KEYS = ("STATUS", "PASS", "P/F")
+
+
+def _find_results_column_map(header_row: List[str]) -> Tuple[int, int]:
+    """
+    Find value and status column indices in results header.
+
+    Args:
+        header_row: List of header cell values
+
+    Returns: Tuple of (value_col_idx, status_col_idx)
+    """
+    value_col = None
+    status_col = None
+
+    # Last matching column wins: scan from the right and stop once both are found
+    for idx in range(len(header_row) - 1, -1, -1):
+        cell = header_row[idx]
+        if not cell:
+            continue
+        cell_upper = cell.upper() if isinstance(cell, str) else str(cell).upper()
+        if value_col is None and any(k in cell_upper for k in _VALUE_HEADER_KEYS):
+            value_col = idx
+        if status_col is None and any(k in cell_upper for k in _STATUS_HEADER_KEYS):
+            status_col = idx
+        if value_col is not None and status_col is not None:
+            break
+
+    return (5 if value_col is None else value_col,  # Default fallback
+            8 if status_col is None else status_col)  # Default fallback
+
+
+# Metadata key keywords -> field, checked in order; the first empty field wins.
+# A key must contain every keyword of its entry.
+_META_KEYS = (
+    (("OPERATOR",), "operator"),
+    (("EQUIPMENT",), "equipment"),
+    (("ASSET",), "equipment"),
+    (("SERIAL",), "tester_sn"),  # Only in the left columns (see parse_fluke_file)
+    (("TEMPLATE",), "template"),
+    (("DATE", "TIME"), "test_date"),
+)
+
+
+# Known test date/time layouts, tried before dateutil's heuristic parser.
+# Month first, matching dateutil's default reading (DTA converter output)
+_DATE_FORMATS = (
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %I:%M:%S %p",
+)
+
+
+def _parse_test_date(test_date: str) -> Optional[datetime]:
+    """
+    Parse a test date string: explicit formats first, dateutil for the rest.
+
+    Returns: datetime, or None if the string cannot be parsed
+    """
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(test_date, fmt)
+        except ValueError:
+            continue
+
+    # Month first (dateutil default), consistent with _DATE_FORMATS: a
+    # date-only "7/8/2024" from the DTA converter means July 8
+    try:
+        return date_parser.parse(test_date)
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def parse_fluke_file(csv_path: str) -> Tuple[Optional[FlukeParsed], Optional[str]]:
+    """
+    Parse Fluke ESA615 CSV file.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Tuple of (FlukeParsed object, error message)
+        If successful: (FlukeParsed, None)
+        If failed: (None, error_message)
+    """
+    try:
+        # Try multiple encodings to handle different CSV file formats.
+        # Read once, then decode: UTF-8 (with or without BOM), else Windows-1252,
+        # else Latin-1 (which accepts any byte)
+        with open(csv_path, 'rb') as f:
+            data = f.read()
+        for encoding in ('utf-8-sig', 'windows-1252', 'latin-1'):
+            try:
+                text = data.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        del data
+
+        # Single streaming pass over the rows:
+        #   - metadata from the first 20 rows
+        #   - results header search until found
+        #   - measurements from the rows after the header
+        meta = dict.fromkeys(("operator", "equipment", "tester_sn", "template", "test_date"), "")
+
+        value_col = None  # Set once the results header is found
+        status_col = None
+        max_col = None
+        measurements = []
+        row_count = 0
+
+        # newline=None: universal newlines, as when reading in text mode
+        reader = csv.reader(io.StringIO(text, newline=None))
+        for idx, row in enumerate(reader):
+            row_count += 1
+
+            # Extract metadata (first ~20 rows)
+            if idx < 20 and len(row) >= 2:
+                # Check all columns in the row for key-value pairs
+                # Fluke CSV format may have multiple key-value pairs per row
+                for i in range(len(row)):
+                    if not row[i] or ':' not in str(row[i]):
+                        continue
+
+                    key = _cellstr(row[i]).upper()
+                    for needles, field in _META_KEYS:
+                        if meta[field] or not all(n in key for n in needles):
+                            continue
+                        if field == "tester_sn" and i >= 5:  # Serial Number in left columns = Tester S/N
+                            continue
+                        break
+                    else:
+                        continue
+
+                    # Value is typically 2 columns after key (skip empty column)
+                    value_idx = i + 2 if i + 2 < len(row) else i + 1
+                    value = _cellstr(row[value_idx]) if value_idx < len(row) else ""
+
+                    if not value:  # If i+2 is empty, try i+1
+                        value_idx = i + 1
+                        value = _cellstr(row[value_idx]) if value_idx < len(row) else ""
+
+                    meta[field] = value
+
+            # Find results header
+            if value_col is None:
+                if len(row) > 0 and _cellstr(row[0]).upper() == "TEST NAME":
+                    # Check if this row has Value column
+                    if any("VALUE" in str(cell).upper() or "RESULT" in str(cell).upper() for cell in row):
+                        value_col, status_col = _find_results_column_map(row)
+                        max_col = max(value_col, status_col)
+                continue
+
+            # Parse measurements (csv.reader cells are always str)
+            if len(row) <= max_col:
+                continue
+
+            test_name = row[0].strip()
+            if not test_name:
+                continue
+
+            # Extract group and condition from test name
+            # Format: "Group - Condition - Subtest" or variations
+            # Group first: unrecognized groups are skipped before splitting the rest
+            dash = test_name.find('-')
+            group = canonical_group((test_name[:dash] if dash >= 0 else test_name).strip())
+            if group is None:
+                continue  # Skip unrecognized groups
+
+            parts = test_name.split('-')
+            raw_cond = parts[1].strip() if len(parts) > 1 else ""
+            subtest = parts[2].strip() if len(parts) > 2 else test_name
+
+            cond = normalize_condition(raw_cond)
+
+            # Extract value
+            value = clean_value(row[value_col].strip())
+            if value is None:
+                continue
+
+            # Status: only the first non-blank character matters
+            pf = "Pass" if row[status_col].lstrip()[:1].upper() == "P" else "Fail"
+
+            measurements.append(Measurement(
+                group=group,
+                cond=cond,
+                subtest=subtest,
+                value=value,
+                pf=pf
+            ))
+
+        del text
+
+        if row_count < 10:
+            return None, "CSV file too short"
+
+        # Validate required fields
+        if not meta["equipment"]:
+            return None, "Missing Equipment Number"
+        if not meta["tester_sn"]:
+            return None, "Missing Tester S/N"
+        if not meta["template"]:
+            return None, "Missing Template Name"
+
+        # Parse datetime
+        dt = _parse_test_date(meta["test_date"]) if meta["test_date"] else None
+        if dt is None:
+            dt = datetime.now()
+
+        if value_col is None:
+            return None, "Could not find results header"
+
+        parsed = FlukeParsed(
+            operator=meta["operator"],
+            equipment=meta["equipment"],
+            tester_sn=meta["tester_sn"],
+            template=meta["template"],
+            dt=dt,
+            measurements=measurements
+        )
+
+        return parsed, None
+
+    except Exception as e:
+        return None, f"Parse error: {str(e)}"
+
+
+# ============================================================================
+# SECTION 4: MAPPING LAYER
+# ============================================================================
+
+# Template number prefix on test sequence names (e.g. "_0001 - ")
+_TEST_SEQ_PREFIX_RE = re.compile(r'^_\d+\s*-\s*')
+
+
+def build_interface_row(parsed: FlukeParsed, tester_map: Dict[str, str]) -> Tuple[Optional[InterfaceRow], List[str]]:
+    """
+    Build InterfaceRow from FlukeParsed data.
+
+    Args:
+        parsed: FlukeParsed object
+        tester_map: Dictionary mapping Tester S/N → Asset Number
+
+    Returns:
+        Tuple of (InterfaceRow object, list of errors)
+        If successful: (InterfaceRow, [])
+        If failed: (None, [error_messages])
+    """
+    errors = []
+
+    # Infer standard and class type (template tokenized once)
+    standard, class_type = _classify_template(parsed.template)
+    if standard is None:
+        errors.append(f"Could not infer standard from template: {parsed.template}")
+        return None, errors
+
+    # Asset number mapping
+    asset_number = tester_map.get(parsed.tester_sn, parsed.tester_sn)
+
+    # Test sequence (strip prefix like "_0001 - ")
+    test_seq = _TEST_SEQ_PREFIX_RE.sub('', parsed.template)
+
+    # Format test date
+    test_date = parsed.dt.strftime("%d/%m/%Y")
+
+    # Initialize row
+    row = InterfaceRow(
+        operator=parsed.operator,
+        equipment_number=parsed.equipment,
+        asset_number=asset_number,
+        standard=standard,
+        test_type="Routine",
+        class_type=class_type,
+        test_seq=test_seq,
+        test_date=test_date,
+        visual_pass_fail="P"  # Assumed
+    )
+
+    # Determine if class is earthed
+    is_earthed = class_is_earthed(class_type, standard)
+
+    # Fixed limits for this standard/class type
+    limits = _limits_for(standard, class_type)
+
+    # Build measurement lookup (first measurement per group/condition)
+    meas_map: Dict[Tuple[str, str], Measurement] = {}
+    for m in parsed.measurements:
+        key = (m.group, m.cond)
+        if key not in meas_map:
+            meas_map[key] = m
+
+    # Helper: Format field value
+    def format_field(meas: Optional[Measurement], limit: str, unit: str) -> str:
+        if meas is None:
+            return "NA"
+        pf_str = "Pass" if meas.pf == "Pass" else "Failed"
+        return f"{meas.value},{pf_str},{limit},{unit}"
+
+    # Line Load (requires both LN and NE)
+    ln_meas = meas_map.get((G_MAINS_V_LN, COND_NC))
+    ne_meas = meas_map.get((G_MAINS_V_NE, COND_NC))
+    if ln_meas and ne_meas:
+        ln_val = ln_meas.value
+        ne_val = ne_meas.value
+        row.line_load = f"{ln_val}V [L-N={ne_val}V][Load=0.0kVA]"
+
+    # Earth Bond
+    if is_earthed:
+        eb_meas = meas_map.get((G_PROT_EARTH_RES, COND_NC))
+        if eb_meas:
+            limit = limits["earth_bond"]
+            row.earth_bond = format_field(eb_meas, limit, "Ohms")
+    else:
+        row.earth_bond = "NA"
+
+    # Insulation
+    ins_meas = meas_map.get((G_INSULATION, COND_NC))
+    if ins_meas:
+        limit = limits["insulation"]
+        # Extract voltage from subtest if present
+        voltage_label = ""
+        if ins_meas.subtest:
+            if "250" in ins_meas.subtest:
+                voltage_label = " [250V]"
+            elif "500" in ins_meas.subtest:
+                voltage_label = " [500V]"
+        unit = f"MOhms{voltage_label}"
+        row.insulation = format_field(ins_meas, limit, unit)
+
+    # Earth Leakage
+    if standard == "AS/NZS 3760" or (standard == "AS/NZS 3551" and is_earthed):
+        el_nc = meas_map.get((G_EARTH_LEAK, COND_NC))
+        el_no = meas_map.get((G_EARTH_LEAK, COND_NO))
+
+        if el_nc:
+            limit = limits["earth_leakage_nc"]
+            row.earth_leakage_nc = format_field(el_nc, limit, "uA")
+
+        if el_no:
+            limit = limits["earth_leakage_no"]
+            row.earth_leakage_no = format_field(el_no, limit, "uA")
+
+    # Enclosure Leakage
+    enc_nc = meas_map.get((G_ENC_LEAK, COND_NC))
+    enc_no = meas_map.get((G_ENC_LEAK, COND_NO))
+    enc_eo = meas_map.get((G_ENC_LEAK, COND_EO))
+
+    if enc_nc:
+        limit = limits["enclosure_leakage_nc"]
+        row.enclosure_leakage_nc = format_field(enc_nc, limit, "uA")
+
+    if enc_no:
+        limit = limits["enclosure_leakage_no"]
+        row.enclosure_leakage_no = format_field(enc_no, limit, "uA")
+
+    if enc_eo:
+        limit = limits["enclosure_leakage_eo"]
+        row.enclosure_leakage_eo = format_field(enc_eo, limit, "uA")
+
+    # Patient / Applied Part Leakage (3551 only, baseline simplification for 3760)
+    if standard == "AS/NZS 3551":
+        pat_nc = meas_map.get((G_PATIENT_LEAK, COND_NC))
+        pat_no = meas_map.get((G_PATIENT_LEAK, COND_NO))
+        pat_eo = meas_map.get((G_PATIENT_LEAK, COND_EO))
+
+        if pat_nc:
+            limit = limits["patient_leakage_nc"]
+            row.applied_part_leakage_nc = format_field(pat_nc, limit, "uA")
+
+        if pat_no:
+            limit = limits["patient_leakage_no"]
+            row.applied_part_leakage_no = format_field(pat_no, limit, "uA")
+
+        if pat_eo:
+            limit = limits["patient_leakage_eo"]
+            row.applied_part_leakage_eo = format_field(pat_eo, limit, "uA")
+
+    # Mains Contact (3551 only)
+    if standard == "AS/NZS 3551":
+        mc_meas = meas_map.get((G_MAINS_ON_AP, COND_NC))
+        if mc_meas:
+            limit = limits["mains_contact"]
+            row.mains_contact = format_field(mc_meas, limit, "uA")
+
+    # Overall Pass/Fail
+    for m in parsed.measurements:
+        if m.pf == "Fail":
+            row.overall_pass_fail = "F"
+            break
+
+    return row, errors
+
+
+# ============================================================================
+# SECTION 5: OUTPUT LAYER
+# ============================================================================
+
+def load_tester_map(tester_path: str = "EST Tester.xlsx") -> Dict[str, str]:
+    """
+    Load tester S/N → Asset Number mapping from EST Tester.xlsx.
+
+    Expected structure:
+        Columns: Serial Number (or S/N), Asset Number
+
+    Returns: Dictionary of S/N → Asset Number
+    """
+    # If relative path, look in application directory
+    if not os.path.isabs(tester_path):
+        tester_path = os.path.join(get_app_dir(), tester_path)
+
+    tester_map = {}
+
+    if not os.path.exists(tester_path):
+        print(f"Warning: {tester_path} not found, using S/N as Asset Number")
+        return tester_map
+
+    try:
+        # Read-only mode streams rows instead of building the whole workbook
+        wb = load_workbook(tester_path, data_only=True, read_only=True)
+        try:
+            ws = wb.active
+
+            # Find header row
+            sn_col = None
+            asset_col = None
+            header_row = None
+
+            for row_idx, row in enumerate(ws.iter_rows(max_row=10, values_only=True), start=1):
+                if row:
+                    for col_idx, cell in enumerate(row):
+                        if cell:
+                            cell_upper = str(cell).upper()
+                            if "SERIAL" in cell_upper or "S/N" in cell_upper:
+                                sn_col = col_idx
+                                header_row = row_idx
+                            if "ASSET" in cell_upper:
+                                asset_col = col_idx
+
+            if sn_col is None or asset_col is None or header_row is None:
+                print("Warning: Could not find S/N or Asset columns in tester file")
+                return tester_map
+
+            # Parse data rows
+            for row in ws.iter_rows(min_row=header_row + 1, values_only=True):
+                if not row or len(row) <= max(sn_col, asset_col):
+                    continue
+
+                sn = _cellstr(row[sn_col])
+                asset = _cellstr(row[asset_col])
+
+                if sn and asset:
+                    tester_map[sn] = asset
+        finally:
+            wb.close()
+
+        print(f"Loaded {len(tester_map)} tester mappings")
+
+    except Exception as e:
+        print(f"Error loading tester map: {e}")
+
+    return tester_map
+
+
+# Template file contents by path, with the (mtime, size) they were read at
+_TEMPLATE_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _read_template_bytes(template_path: str) -> bytes:
+    """Return the template file's bytes, re-reading only if the file changed."""
+    st = os.stat(template_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(template_path, 'rb') as f:
+        data = f.read()
+    _TEMPLATE_CACHE[template_path] = (stamp, data)
+    return data
+
+
+def append_rows_to_template(
+    template_path: str,
+    output_path: str,
+    rows: List[InterfaceRow]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Append InterfaceRows to template XLSX and save as new file.
+
+    Args:
+        template_path: Path to example_Good.xlsx template
+        output_path: Path to save output file
+        rows: List of InterfaceRow objects to append
+
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+    """
+    try:
+        # Load template (file contents cached across calls)
+        wb = load_workbook(io.BytesIO(_read_template_bytes(template_path)))
+        ws = wb.active
+
+        # Append rows after the last row with data (one tuple per row)
+        for row in rows:
+            ws.append(row.to_tuple())
+
+        # Save
+        wb.save(output_path)
+        return True, None
+
+    except Exception as e:
+        return False, f"Output error: {str(e)}"
+
+
+# ============================================================================
+# SECTION 6: CONVERSION ORCHESTRATION
+# ============================================================================
+
+# Worker processes only pay off for large batches. Measured with spawn (the
+# Windows start method): a worker takes ~100 ms to start, a file takes
+# ~0.4-1 ms to convert in-process. Below this many files the serial loop wins
+_PARALLEL_MIN_FILES = 500
+
+# Start one worker per this many files (never more than the CPU count), so
+# each worker has enough work to cover its start-up
+_FILES_PER_WORKER = 250
+
+# Files go to workers in chunks (one IPC round trip each, ~0.2 ms per file
+# when sent singly); about this many chunks per worker keeps the load even
+_CHUNKS_PER_WORKER = 4
+
+
+def _init_convert_worker(limits: Dict[str, str]):
+    """Worker process initializer: install the limits loaded by the parent."""
+    global _LIMITS_CACHE
+    _LIMITS_CACHE = limits
+    _limits_for.cache_clear()
+
+
+def _convert_one(csv_path: str, tester_map: Dict[str, str]) -> Tuple[Optional[InterfaceRow], Optional[str]]:
+    """
+    Parse one Fluke CSV and build its InterfaceRow.
+
+    Returns:
+        (InterfaceRow, None) on success, (None, error_message) on failure
+    """
+    parsed, error = parse_fluke_file(csv_path)
+    if parsed is None:
+        return None, error
+
+    row, row_errors = build_interface_row(parsed, tester_map)
+    if row is None:
+        return None, "; ".join(row_errors) if row_errors else "Unknown error"
+
+    return row, None
+
+
+def _convert_chunk(csv_paths: List[str], tester_map: Dict[str, str]) -> List[Tuple[Optional[InterfaceRow], Optional[str]]]:
+    """Worker task: _convert_one for each path, in order."""
+    return [_convert_one(p, tester_map) for p in csv_paths]
+
+
+def _is_plain_csv_field(value) -> bool:
+    """True if csv.writer would write value unchanged (no quoting needed)."""
+    return isinstance(value, str) and not any(c in value for c in ',"\r\n')
+
+
+def convert_files(
+    csv_paths: List[str],
+    output_folder: str,
+    template_path: str,
+    progress_callback=None
+) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """
+    Convert multiple Fluke CSV files to single XLSX output.
+
+    Args:
+        csv_paths: List of CSV file paths
+        output_folder: Output directory
+        template_path: Path to example_Good.xlsx
+        progress_callback: Optional callback(current, total, message)
+
+    Returns:
+        Tuple of (success_count, error_count, error_list)
+        error_list: List of (filename, error_message) tuples
+    """
+    # Load dependencies
+    load_fixed_limits_from_summary()
+    tester_map = load_tester_map()
+
+    # Results
+    interface_rows = []
+    errors = []
+
+    total = len(csv_paths)
+
+    filenames = [os.path.basename(p) for p in csv_paths]
+
+    # Parse + map each file (independent per file; in worker processes for
+    # large batches). Progress is reported as each file finishes; results
+    # are stored by index so rows and errors keep input order.
+    workers = min(os.cpu_count() or 1, math.ceil(total / _FILES_PER_WORKER))
+    if total >= _PARALLEL_MIN_FILES and workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_convert_worker, initargs=(_LIMITS_CACHE,))
+        size = math.ceil(total / (workers * _CHUNKS_PER_WORKER))
+        futures = {executor.submit(_convert_chunk, csv_paths[start:start + size], tester_map): start
+                   for start in range(0, total, size)}
+        results = ((futures[fut] + offset, outcome)
+                   for fut in as_completed(futures)
+                   for offset, outcome in enumerate(fut.result()))
+    else:
+        executor = None
+        results = ((idx, _convert_one(p, tester_map)) for idx, p in enumerate(csv_paths))
+
+    outcomes = [None] * total
+    done = 0
+    try:
+        for idx, outcome in results:
+            outcomes[idx] = outcome
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, f"Processing {filenames[idx]}")
+    except BrokenProcessPool:
+        # A worker process died (crash, killed, out of memory): the files it
+        # left unfinished are converted serially below
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for idx, p in enumerate(csv_paths):
+        if outcomes[idx] is None:
+            outcomes[idx] = _convert_one(p, tester_map)
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, f"Processing {filenames[idx]}")
+
+    for filename, (row, error) in zip(filenames, outcomes):
+        if row is None:
+            errors.append((filename, error))
+        else:
+            interface_rows.append(row)
+
+    # Generate output files
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Write successful rows to XLSX
+    if interface_rows:
+        output_xlsx = os.path.join(output_folder, f"EST_UPLOAD_{timestamp}.xlsx")
+        success, error = append_rows_to_template(template_path, output_xlsx, interface_rows)
+        if not success:
+            errors.append(("Output XLSX", error))
+
+    # Write error CSV if any errors
+    if errors:
+        error_csv = os.path.join(output_folder, f"EST_ERRORS_{timestamp}.csv")
+        try:
+            with open(error_csv, 'w', newline='', encoding='utf-8') as f:
+                if all(_is_plain_csv_field(field) for entry in errors for field in entry):
+                    # Nothing to quote: same bytes as csv.writer, in one write
+                    f.write("File,Error\r\n" + "".join(f"{name},{msg}\r\n" for name, msg in errors))
+                else:
+                    writer = csv.writer(f)
+                    writer.writerow(["File", "Error"])
+                    writer.writerows(errors)
+        except Exception as e:
+            print(f"Failed to write error CSV: {e}")
+
+    success_count = len(interface_rows)
+    error_count = len(errors)
+
+    return success_count, error_count, errors
@@ -3,6 +3,22 @@
 import os
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_pyc(root):
+    """Yield paths of .pyc files under root (scandir: no extra stat per entry)"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return  # Unreadable directory: skip it, like os.walk does
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_pyc(entry.path)
+            elif entry.name.endswith('.pyc'):
+                yield entry.path
+
 
 print("=" * 70)
 print("EST Converter UI Fix Tool")
@@ -18,12 +34,11 @@ else:
 
 # Step 2: Clear .pyc files
 print("\n2. Clearing compiled Python files...")
-count = 0
-for root, dirs, files in os.walk('.'):
-    for file in files:
-        if file.endswith('.pyc'):
-            os.remove(os.path.join(root, file))
-            count += 1
+pyc_paths = list(iter_pyc('.'))
+# Unlink releases the GIL, so removals overlap across threads
+with ThreadPoolExecutor(max_workers=32) as executor:
+    list(executor.map(os.remove, pyc_paths))
+count = len(pyc_paths)
 if count > 0:
     print(f"   ✅ Removed {count} .pyc files")
 else:
@@ -71,12 +86,13 @@ print("=" * 70)
 # Step 5: Try to import and check UI code
 print("\nVerifying UI code...")
 try:
-    # Read a small portion to verify fixes
-    with open('est_converter.py', 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
-        
+    # Read the UI and conversion modules to verify fixes
+    code = ''
+    for name in ('est_converter.py', 'est_core.py'):
+        with open(name, 'r', encoding='utf-8', errors='ignore') as f:
+            code += f.read()
+    
     # Look for key UI fixes
-    code = ''.join(lines)
     
     checks = {
         'Multi-encoding support': 'Try multiple encodings' in code,
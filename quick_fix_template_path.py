@@ -11,7 +11,7 @@ print("=" * 70)
 print("\nReading est_converter.py...")
 try:
     with open('est_converter.py', 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
+        text = f.read()
 except Exception as e:
     print(f"❌ Error: {e}")
     input("Press Enter to exit...")
@@ -21,31 +21,32 @@ except Exception as e:
 print("Creating backup: est_converter.py.backup")
 shutil.copy('est_converter.py', 'est_converter.py.backup')
 
-# Find and modify the template path section
-modified = False
-new_lines = []
+# Find and modify the template path section (first occurrence only)
+marker = 'self.template_path = "example_Good.xlsx"'
+pos = text.find(marker)
+modified = pos >= 0
 
-for i, line in enumerate(lines):
-    # Look for the template path initialization
-    if 'self.template_path = "example_Good.xlsx"' in line and not modified:
-        indent = len(line) - len(line.lstrip())
-        new_lines.append(line)
-        # Add code to use script directory
-        new_lines.append(' ' * indent + '# Auto-fix: Use script directory for template files\n')
-        new_lines.append(' ' * indent + 'script_dir = os.path.dirname(os.path.abspath(__file__))\n')
-        new_lines.append(' ' * indent + 'self.template_path = os.path.join(script_dir, "example_Good.xlsx")\n')
-        modified = True
-        print(f"✅ Modified line {i+1}: Added script directory path resolution")
-        # Skip the original line we just replaced
-        continue
-    else:
-        new_lines.append(line)
+if modified:
+    line_start = text.rfind('\n', 0, pos) + 1
+    line_end = text.find('\n', pos)
+    line_end = len(text) if line_end < 0 else line_end + 1
+    line = text[line_start:line_end]
+    indent = ' ' * (len(line) - len(line.lstrip()))
+    # Keep the original line; add code to use script directory after it
+    added = (
+        ('' if line.endswith('\n') else '\n')
+        + indent + '# Auto-fix: Use script directory for template files\n'
+        + indent + 'script_dir = os.path.dirname(os.path.abspath(__file__))\n'
+        + indent + 'self.template_path = os.path.join(script_dir, "example_Good.xlsx")\n'
+    )
+    text = text[:line_end] + added + text[line_end:]
+    print(f"✅ Modified line {text.count(chr(10), 0, pos) + 1}: Added script directory path resolution")
 
 if modified:
     # Write modified file
     print("\nWriting modified est_converter.py...")
     with open('est_converter.py', 'w', encoding='utf-8', errors='ignore') as f:
-        f.writelines(new_lines)
+        f.write(text)
     
     print("\n" + "=" * 70)
     print("SUCCESS!")
@@ -3,9 +3,10 @@
 import sys
 sys.path.insert(0, '.')
 
-from est_converter import parse_fluke_file
-
 def test_file(csv_path):
+    # Imported here so the usage path doesn't pay for dateutil/openpyxl
+    from est_core import parse_fluke_file
+
     print(f"Testing: {csv_path}")
     print("-" * 60)
     
@@ -10,15 +10,18 @@ print("=" * 70)
 # Check if files exist
 required_files = [
     'est_converter.py',
+    'est_core.py',
     'example_Good.xlsx',
     'quick_test.py',
     'RUN_INSTRUCTIONS.md'
 ]
 
 print("\n1. Checking required files:")
+# One directory read instead of a stat per file (normcase: case-insensitive on Windows)
+present = {os.path.normcase(entry.name) for entry in os.scandir('.')}
 all_exist = True
 for f in required_files:
-    exists = os.path.exists(f)
+    exists = os.path.normcase(f) in present
     status = "✅" if exists else "❌"
     print(f"   {status} {f}")
     if not exists:
@@ -26,23 +29,28 @@ for f in required_files:
 
 # Check encoding fix in code
 print("\n2. Checking encoding fix:")
+has_encoding_fix = False  # Also decides the final recommendation (no second read)
 try:
-    with open('est_converter.py', 'r', encoding='utf-8') as f:
+    # Markers are plain ASCII: search the raw bytes, no decode needed
+    with open('est_core.py', 'rb') as f:
         content = f.read()
-        
-    if "Try multiple encodings" in content:
+
+    has_encoding_fix = b"Try multiple encodings" in content
+    if has_encoding_fix:
         print("   ✅ Multi-encoding support found")
-        # Count how many encodings are supported
-        if "windows-1252" in content and "latin-1" in content:
-            print("   ✅ All 5 encodings configured (utf-8-sig, utf-8, windows-1252, latin-1, iso-8859-1)")
+        # Check the full encoding list is configured
+        if b"('utf-8-sig', 'windows-1252', 'latin-1')" in content:
+            print("   ✅ All 3 encodings configured (utf-8-sig, windows-1252, latin-1)")
         else:
             print("   ⚠️  Encoding list incomplete")
     else:
         print("   ❌ Multi-encoding support NOT found (old version)")
         print("   You are running the OLD version!")
         
-    # Check UI fixes
-    if 'background: transparent' in content and 'logo_label.setFixedSize(60, 60)' in content:
+    # Check UI fixes (UI layer stays in est_converter.py)
+    with open('est_converter.py', 'rb') as f:
+        content = f.read()
+    if b'background: transparent' in content and b'logo_label.setFixedSize(60, 60)' in content:
         print("   ✅ UI fixes applied (transparent backgrounds + fixed logo)")
     else:
         print("   ❌ UI fixes NOT applied")
@@ -56,10 +64,11 @@ if os.path.exists('__pycache__'):
     print("   ⚠️  __pycache__ directory exists (may cause issues)")
     print("   Recommendation: Delete it and restart")
     
-    # List cached files
-    cache_files = os.listdir('__pycache__')
-    if cache_files:
-        print(f"   Found {len(cache_files)} cached files")
+    # Count cached files (scandir: no list of names)
+    with os.scandir('__pycache__') as entries:
+        cache_count = sum(1 for _ in entries)
+    if cache_count:
+        print(f"   Found {cache_count} cached files")
 else:
     print("   ✅ No cache directory found")
 
@@ -77,7 +86,7 @@ print("=" * 70)
 
 if not all_exist:
     print("❌ Missing required files. Please re-download the latest code.")
-elif "Try multiple encodings" not in open('est_converter.py').read():
+elif not has_encoding_fix:
     print("❌ You have OLD code. Download latest from branch: claude/est-converter-baseline-sbRr5")
 elif os.path.exists('__pycache__'):
     print("⚠️  Delete __pycache__ folder and restart:")